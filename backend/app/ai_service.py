@@ -12,7 +12,7 @@ making it a drop-in replacement in the websocket_manager.
 
 import os
 import logging
-from typing import Dict, Optional, Tuple
+from typing import Any, Awaitable, Callable, Dict, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +35,74 @@ except Exception as e:
     GeminiService = None
 
 
+# Errors from LM Studio that are worth retrying on Gemini
+# These mean LM Studio itself is unreachable or too slow. Anything else (bad
+# interview_id, malformed response, programming errors) fails fast instead of
+# paying for a second round-trip that cannot help
+_FALLBACK_ERRORS = (ConnectionError, TimeoutError)
+
+# Marker both services' prompts ask the model to end the interview with
+_END_MARKER = "INTERVIEW_END"
+
+
+class _ChunkRelay:
+    """
+    Forwards a streamed reply to the client, minus the end-of-interview marker.
+    
+    Text that could be the start of the marker is held back until the next
+    chunk shows it isn't. Once the marker appears, the reply is the final
+    feedback rather than a question, so the text shown so far is discarded
+    and nothing more is forwarded (INTERVIEW_END carries the feedback).
+    
+    Args:
+        on_chunk: Coroutine called with each piece of text to show
+        on_reset: Coroutine called to discard the text shown so far
+    """
+    
+    def __init__(
+        self,
+        on_chunk: Callable[[str], Awaitable[None]],
+        on_reset: Optional[Callable[[], Awaitable[None]]]
+    ):
+        self._on_chunk = on_chunk
+        self._on_reset = on_reset
+        self._pending = ""  # Held back: might be the start of the marker
+        self._sent = False  # Whether anything was forwarded since the last reset
+        self._ended = False  # Marker seen; the rest of the reply is dropped
+    
+    async def chunk(self, delta: str):
+        """Forward a newly streamed piece of the reply."""
+        if self._ended:
+            return
+        text = self._pending + delta
+        if _END_MARKER in text:
+            self._ended = True
+            await self._discard()
+            return
+        # Keep back the longest tail that is a prefix of the marker
+        keep = 0
+        for size in range(min(len(_END_MARKER) - 1, len(text)), 0, -1):
+            if text.endswith(_END_MARKER[:size]):
+                keep = size
+                break
+        self._pending = text[len(text) - keep:] if keep else ""
+        text = text[:len(text) - keep]
+        if text:
+            self._sent = True
+            await self._on_chunk(text)
+    
+    async def restart(self):
+        """Discard what was streamed so far before another reply is streamed."""
+        self._ended = False
+        await self._discard()
+    
+    async def _discard(self):
+        self._pending = ""
+        if self._sent and self._on_reset is not None:
+            self._sent = False
+            await self._on_reset()
+
+
 class UnifiedAIService:
     """
     Unified AI service that automatically falls back between LM Studio and Gemini.
@@ -48,6 +116,12 @@ class UnifiedAIService:
     
     The service maintains conversation state and delegates to the appropriate
     underlying service (LM Studio or Gemini) based on availability and success.
+    
+    Concurrency: every method is a coroutine and never blocks the event loop,
+    so answers from different interviews are sent to the AI backends at the
+    same time as they arrive. There is no batching queue on purpose - each
+    call is a separate chat request, so collecting them into a batch window
+    would only add latency without reducing the number of API calls.
     """
     
     def __init__(self):
@@ -72,7 +146,14 @@ class UnifiedAIService:
         # Track which service to use for each interview
         # Once we've successfully used a service for an interview, stick with it
         # This prevents switching mid-interview which could break context
-        self.interview_service_map: Dict[str, str] = {}  # interview_id -> "lm_studio" or "gemini"
+        # The resolved service instance is stored alongside its name so the
+        # per-answer hot path is a single dict lookup
+        self.interview_service_map: Dict[str, Tuple[object, str]] = {}  # interview_id -> (service, "lm_studio" or "gemini")
+        
+        # Interviews that fell back from LM Studio to Gemini
+        # Only these can have state left behind in LM Studio, so cleanup only
+        # touches the non-assigned service for IDs in this set
+        self._switched_interviews: Set[str] = set()
         
         logger.info(f"Unified AI Service initialized. LM Studio: {LM_STUDIO_AVAILABLE}, Gemini: {GEMINI_AVAILABLE}, Prefer LM Studio: {self.prefer_lm_studio}")
     
@@ -89,13 +170,8 @@ class UnifiedAIService:
         if self._lm_studio_service is None:
             try:
                 self._lm_studio_service = get_lm_studio_service()
-                # Test if it's actually working by checking if we can get models
-                # This is a lightweight check that doesn't require a full conversation
-                try:
-                    # Just verify the service was created - actual connection test happens in __init__
-                    logger.info("LM Studio service instance created")
-                except Exception as e:
-                    logger.warning(f"LM Studio service created but may not be fully functional: {e}")
+                # The connection test happens lazily on the service's first request
+                logger.info("LM Studio service instance created")
             except Exception as e:
                 logger.warning(f"Failed to initialize LM Studio service: {e}")
                 return None
@@ -121,6 +197,74 @@ class UnifiedAIService:
         
         return self._gemini_service
     
+    async def warmup(self):
+        """
+        Create both underlying services ahead of the first interview.
+        
+        Service construction is lazy, so without this the first interview pays
+        for Gemini's client setup on its critical path. LM Studio's connection
+        test and model detection still run on its first request, so a slow or
+        missing LM Studio never delays startup. Called once from the FastAPI
+        startup event.
+        
+        If GEMINI_WARMUP_PROBE is "true", a tiny generate request is also sent
+        to Gemini so its connection is open before the first user turn.
+        Failures are logged and ignored - the lazy paths still work.
+        """
+        # LM Studio's constructor is cheap; it checks the connection on first use
+        self._get_lm_studio_service()
+        gemini = self._get_gemini_service()
+        
+        if gemini and os.getenv("GEMINI_WARMUP_PROBE", "false").lower() == "true":
+            try:
+                await gemini.model.generate_content_async(
+                    "ping",
+                    generation_config={"max_output_tokens": 1}
+                )
+                logger.info("Gemini warm-up probe succeeded")
+            except Exception as e:
+                logger.warning(f"Gemini warm-up probe failed: {e}")
+    
+    async def _try_gemini_fallback(
+        self,
+        interview_id: str,
+        call_fn: Callable[[Any], Awaitable[Any]],
+        primary_error: Exception
+    ) -> Any:
+        """
+        Retry an operation on Gemini after LM Studio failed.
+        
+        On success the interview is reassigned to Gemini for the rest of its
+        lifetime and marked as switched so cleanup also clears LM Studio.
+        
+        Args:
+            interview_id: The interview being processed
+            call_fn: Takes the Gemini service and returns the coroutine to await
+            primary_error: The LM Studio error that triggered the fallback
+            
+        Returns:
+            Whatever call_fn's coroutine returns
+            
+        Raises:
+            Exception: If Gemini is unavailable or also fails
+        """
+        gemini = self._get_gemini_service()
+        if not gemini:
+            raise Exception(f"LM Studio failed and Gemini is not available. LM Studio error: {str(primary_error)}")
+        
+        logger.info(f"Falling back to Gemini for interview {interview_id}")
+        try:
+            result = await call_fn(gemini)
+        except Exception as gemini_error:
+            logger.error(f"Gemini fallback also failed: {gemini_error}")
+            raise Exception(f"Both LM Studio and Gemini failed. LM Studio error: {str(primary_error)}, Gemini error: {str(gemini_error)}")
+        
+        self.interview_service_map[interview_id] = (gemini, "gemini")
+        self._switched_interviews.add(interview_id)
+        self.current_service = "gemini"
+        logger.info(f"Successfully used Gemini (fallback) for interview {interview_id}")
+        return result
+    
     def _select_service_for_interview(self, interview_id: str) -> Tuple[Optional[object], str]:
         """
         Select which service to use for an interview.
@@ -139,32 +283,22 @@ class UnifiedAIService:
         """
         # If interview already has a service assigned, use it
         # This maintains context throughout the interview
-        if interview_id in self.interview_service_map:
-            service_name = self.interview_service_map[interview_id]
-            if service_name == "lm_studio":
-                service = self._get_lm_studio_service()
-                if service:
-                    return service, "lm_studio"
-            elif service_name == "gemini":
-                service = self._get_gemini_service()
-                if service:
-                    return service, "gemini"
-            # If assigned service is no longer available, clear assignment and try again
-            logger.warning(f"Previously assigned service '{service_name}' for interview {interview_id} is no longer available. Trying fallback.")
-            del self.interview_service_map[interview_id]
+        assigned = self.interview_service_map.get(interview_id)
+        if assigned is not None:
+            return assigned
         
         # Try LM Studio first if preferred and available
         if self.prefer_lm_studio:
             lm_studio = self._get_lm_studio_service()
             if lm_studio:
-                self.interview_service_map[interview_id] = "lm_studio"
+                self.interview_service_map[interview_id] = (lm_studio, "lm_studio")
                 logger.info(f"Using LM Studio for interview {interview_id}")
                 return lm_studio, "lm_studio"
         
         # Fallback to Gemini
         gemini = self._get_gemini_service()
         if gemini:
-            self.interview_service_map[interview_id] = "gemini"
+            self.interview_service_map[interview_id] = (gemini, "gemini")
             logger.info(f"Using Gemini for interview {interview_id}")
             return gemini, "gemini"
         
@@ -172,7 +306,7 @@ class UnifiedAIService:
         logger.error("No AI service available (neither LM Studio nor Gemini)")
         return None, None
     
-    def initialize_conversation(self, interview_id: str) -> str:
+    async def initialize_conversation(self, interview_id: str) -> str:
         """
         Initialize a new interview conversation and get the greeting.
         
@@ -199,38 +333,31 @@ class UnifiedAIService:
         
         try:
             # Try to initialize conversation with selected service
-            greeting = service.initialize_conversation(interview_id)
+            greeting = await service.initialize_conversation(interview_id)
             logger.info(f"Successfully initialized conversation with {service_name} for interview {interview_id}")
             return greeting
             
         except Exception as e:
             logger.warning(f"Failed to initialize conversation with {service_name} for interview {interview_id}: {e}")
             
-            # If LM Studio failed and we haven't tried Gemini yet, try Gemini
-            if service_name == "lm_studio" and self.prefer_lm_studio:
-                logger.info(f"Falling back to Gemini for interview {interview_id}")
-                # Clear the assignment so we can try Gemini
-                if interview_id in self.interview_service_map:
-                    del self.interview_service_map[interview_id]
-                
-                gemini = self._get_gemini_service()
-                if gemini:
-                    try:
-                        greeting = gemini.initialize_conversation(interview_id)
-                        self.interview_service_map[interview_id] = "gemini"
-                        self.current_service = "gemini"
-                        logger.info(f"Successfully initialized conversation with Gemini (fallback) for interview {interview_id}")
-                        return greeting
-                    except Exception as gemini_error:
-                        logger.error(f"Gemini fallback also failed: {gemini_error}")
-                        raise Exception(f"Both LM Studio and Gemini failed. LM Studio error: {str(e)}, Gemini error: {str(gemini_error)}")
-                else:
-                    raise Exception(f"LM Studio failed and Gemini is not available. LM Studio error: {str(e)}")
+            # If LM Studio is unreachable and we haven't tried Gemini yet, try Gemini
+            if service_name == "lm_studio" and isinstance(e, _FALLBACK_ERRORS):
+                return await self._try_gemini_fallback(
+                    interview_id,
+                    lambda gemini: gemini.initialize_conversation(interview_id),
+                    e
+                )
             
             # If Gemini failed or we're already using Gemini, re-raise the error
             raise Exception(f"Failed to initialize conversation with {service_name}: {str(e)}")
     
-    def process_answer(self, interview_id: str, user_answer: str) -> Dict:
+    async def process_answer(
+        self,
+        interview_id: str,
+        user_answer: str,
+        on_chunk: Optional[Callable[[str], Awaitable[None]]] = None,
+        on_reset: Optional[Callable[[], Awaitable[None]]] = None
+    ) -> Dict:
         """
         Process user's answer and get next question or end signal.
         
@@ -240,6 +367,11 @@ class UnifiedAIService:
         Args:
             interview_id: Which interview this answer belongs to
             user_answer: The text transcript of what the user said
+            on_chunk: Optional coroutine called with partial response text as it
+                      streams in (without the INTERVIEW_END marker)
+            on_reset: Optional coroutine called when the text streamed so far
+                      must be discarded: the reply turned out to be the final
+                      feedback, or Gemini takes over a half-streamed reply
             
         Returns:
             Dict with keys:
@@ -254,107 +386,94 @@ class UnifiedAIService:
         """
         # Get the service assigned to this interview
         # If no service is assigned, this shouldn't happen (initialize_conversation should be called first)
-        if interview_id not in self.interview_service_map:
+        assigned = self.interview_service_map.get(interview_id)
+        if assigned is None:
             raise ValueError(f"Interview {interview_id} not initialized. Call initialize_conversation first.")
         
-        service_name = self.interview_service_map[interview_id]
-        
-        # Get the appropriate service instance
-        if service_name == "lm_studio":
-            service = self._get_lm_studio_service()
-            if not service:
-                # LM Studio became unavailable, try Gemini fallback
-                logger.warning(f"LM Studio unavailable for interview {interview_id}, trying Gemini fallback")
-                service = self._get_gemini_service()
-                if service:
-                    service_name = "gemini"
-                    self.interview_service_map[interview_id] = "gemini"
-                    logger.info(f"Switched to Gemini for interview {interview_id}")
-                else:
-                    raise Exception("LM Studio unavailable and Gemini is not available")
-        else:  # gemini
-            service = self._get_gemini_service()
-            if not service:
-                raise Exception("Gemini service is not available")
+        service, service_name = assigned
         
         self.current_service = service_name
         
+        # Both services stream their reply through the relay, which filters
+        # out the end marker before it reaches on_chunk
+        relay = _ChunkRelay(on_chunk, on_reset) if on_chunk is not None else None
+        relay_chunk = relay.chunk if relay is not None else None
+        
         try:
             # Process answer with the selected service
-            result = service.process_answer(interview_id, user_answer)
+            result = await service.process_answer(interview_id, user_answer, relay_chunk)
             return result
             
         except Exception as e:
             logger.warning(f"Failed to process answer with {service_name} for interview {interview_id}: {e}")
             
-            # If LM Studio failed and we haven't tried Gemini yet, try Gemini
-            if service_name == "lm_studio":
-                gemini = self._get_gemini_service()
-                if gemini:
-                    try:
-                        logger.info(f"Falling back to Gemini for processing answer in interview {interview_id}")
-                        # Note: This might lose some context since we're switching services mid-interview
-                        # But it's better than failing completely
-                        result = gemini.process_answer(interview_id, user_answer)
-                        self.interview_service_map[interview_id] = "gemini"
-                        self.current_service = "gemini"
-                        logger.info(f"Successfully processed answer with Gemini (fallback) for interview {interview_id}")
-                        return result
-                    except Exception as gemini_error:
-                        logger.error(f"Gemini fallback also failed: {gemini_error}")
-                        raise Exception(f"Both LM Studio and Gemini failed. LM Studio error: {str(e)}, Gemini error: {str(gemini_error)}")
+            # If LM Studio is unreachable and we haven't tried Gemini yet, try Gemini
+            # Gemini has never seen this interview, so its chat is seeded with
+            # the LM Studio conversation first to carry the context over
+            if service_name == "lm_studio" and isinstance(e, _FALLBACK_ERRORS):
+                async def continue_on_gemini(gemini):
+                    conversation = service.conversations.get(interview_id)
+                    if conversation is not None:
+                        await gemini.seed_conversation(interview_id, conversation)
+                    # LM Studio may have streamed part of a reply before failing
+                    if relay is not None:
+                        await relay.restart()
+                    return await gemini.process_answer(interview_id, user_answer, relay_chunk)
+                
+                return await self._try_gemini_fallback(interview_id, continue_on_gemini, e)
             
             # Re-raise the error if no fallback is available
             raise Exception(f"Failed to process answer with {service_name}: {str(e)}")
     
-    def cleanup(self, interview_id: str):
+    async def cleanup(self, interview_id: str):
         """
         Clean up conversation history for an interview.
         
-        Cleans up both services (if they have state for this interview)
-        and removes the interview from the service map.
+        Cleans up the service assigned to this interview and removes the
+        interview from the service map. LM Studio is only cleaned up as well
+        if the interview switched to Gemini mid-way.
         
         Args:
             interview_id: The interview to clean up
         """
         # Clean up the service that was used for this interview
-        if interview_id in self.interview_service_map:
-            service_name = self.interview_service_map[interview_id]
+        # pop() removes it from the service map in the same lookup
+        assigned = self.interview_service_map.pop(interview_id, None)
+        if assigned is not None:
+            service, service_name = assigned
             
-            if service_name == "lm_studio":
-                service = self._get_lm_studio_service()
-                if service:
-                    try:
-                        service.cleanup(interview_id)
-                    except:
-                        pass  # Ignore cleanup errors
-            
-            elif service_name == "gemini":
-                service = self._get_gemini_service()
-                if service:
-                    try:
-                        service.cleanup(interview_id)
-                    except:
-                        pass  # Ignore cleanup errors
-            
-            # Remove from service map
-            del self.interview_service_map[interview_id]
-        
-        # Also try to clean up in the other service (in case of mid-interview switch)
-        # This is safe even if the service doesn't have state for this interview
-        lm_studio = self._get_lm_studio_service()
-        if lm_studio:
             try:
-                lm_studio.cleanup(interview_id)
+                if service_name == "gemini":
+                    await service.cleanup(interview_id)
+                else:
+                    service.cleanup(interview_id)
             except:
-                pass
+                pass  # Ignore cleanup errors
         
-        gemini = self._get_gemini_service()
-        if gemini:
+        # If the interview switched from LM Studio to Gemini, LM Studio may still
+        # hold its history. Use the existing instance only - never create one
+        # just to clean up
+        if interview_id in self._switched_interviews:
+            self._switched_interviews.discard(interview_id)
+            if self._lm_studio_service is not None:
+                try:
+                    self._lm_studio_service.cleanup(interview_id)
+                except:
+                    pass
+
+    
+    async def close(self):
+        """
+        Release the underlying services' network resources.
+        
+        Only LM Studio holds a client that needs explicit closing. Called once
+        from the FastAPI shutdown event.
+        """
+        if self._lm_studio_service is not None:
             try:
-                gemini.cleanup(interview_id)
-            except:
-                pass
+                await self._lm_studio_service.close()
+            except Exception as e:
+                logger.warning(f"Failed to close LM Studio client: {e}")
 
 
 # Global unified AI service instance (lazy initialization)
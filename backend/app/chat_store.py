@@ -0,0 +1,125 @@
+"""
+Shared chat history store backed by Redis.
+
+Gemini chat sessions live in the memory of the worker that created them. If a
+later turn of the same interview reaches a different worker (or the worker
+restarts), the session is gone and the interview would lose its context.
+
+This module persists each interview's chat history to Redis after every turn
+so any worker can rebuild the chat session on a cache miss. It is optional:
+the store is only enabled when REDIS_URL is set and the redis package is
+installed. Without it, the service behaves exactly as before (in-memory only).
+
+History is stored as JSON in the same shape Gemini's start_chat() accepts:
+[{"role": "user", "parts": ["..."]}, {"role": "model", "parts": ["..."]}, ...]
+"""
+
+import os
+import json
+import logging
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# redis is an optional dependency - only needed when REDIS_URL is configured
+try:
+    import redis.asyncio as redis_asyncio
+    REDIS_AVAILABLE = True
+except ImportError:
+    redis_asyncio = None
+    REDIS_AVAILABLE = False
+
+
+class ChatHistoryStore:
+    """
+    Persists chat histories in Redis, keyed by interview_id.
+
+    Entries expire after a TTL so abandoned interviews don't accumulate.
+    All methods swallow Redis errors and log them: the store is a resilience
+    layer, and a Redis outage should not break interviews that still have
+    their in-memory session.
+    """
+
+    def __init__(self, url: str, ttl_seconds: int = 3600):
+        """
+        Initialize the store.
+
+        Args:
+            url: Redis connection URL (e.g. redis://localhost:6379/0)
+            ttl_seconds: How long a history is kept after its last update
+        """
+        # The client holds a connection pool, so it is created once and reused
+        self._client = redis_asyncio.from_url(url)
+        self.ttl_seconds = ttl_seconds
+
+    @staticmethod
+    def _key(interview_id: str) -> str:
+        """Build the Redis key for an interview's history."""
+        return f"chat:{interview_id}"
+
+    async def save(self, interview_id: str, history: List[Dict]):
+        """
+        Save an interview's chat history, replacing any previous value.
+
+        Args:
+            interview_id: The interview the history belongs to
+            history: List of {"role": ..., "parts": [...]} dicts
+        """
+        try:
+            await self._client.set(self._key(interview_id), json.dumps(history), ex=self.ttl_seconds)
+        except Exception as e:
+            logger.warning(f"Failed to save chat history for {interview_id}: {e}")
+
+    async def load(self, interview_id: str) -> Optional[List[Dict]]:
+        """
+        Load an interview's chat history.
+
+        Args:
+            interview_id: The interview to load
+
+        Returns:
+            The stored history, or None if missing or Redis is unreachable
+        """
+        try:
+            raw = await self._client.get(self._key(interview_id))
+        except Exception as e:
+            logger.warning(f"Failed to load chat history for {interview_id}: {e}")
+            return None
+        return json.loads(raw) if raw else None
+
+    async def delete(self, interview_id: str):
+        """
+        Delete an interview's chat history.
+
+        Args:
+            interview_id: The interview to delete
+        """
+        try:
+            await self._client.delete(self._key(interview_id))
+        except Exception as e:
+            logger.warning(f"Failed to delete chat history for {interview_id}: {e}")
+
+
+# Global store instance (lazy initialization)
+_chat_store: Optional[ChatHistoryStore] = None
+_chat_store_checked = False
+
+def get_chat_store() -> Optional[ChatHistoryStore]:
+    """
+    Get the global chat history store, if one is configured.
+
+    Returns:
+        ChatHistoryStore if REDIS_URL is set and redis is installed, None otherwise
+    """
+    global _chat_store, _chat_store_checked
+    if not _chat_store_checked:
+        _chat_store_checked = True
+        url = os.getenv("REDIS_URL")
+        if url:
+            if REDIS_AVAILABLE:
+                ttl = int(os.getenv("CHAT_HISTORY_TTL", "3600"))
+                _chat_store = ChatHistoryStore(url, ttl)
+                logger.info("Chat history store enabled (Redis)")
+            else:
+                logger.warning("REDIS_URL is set but the redis package is not installed. Chat history will not be shared.")
+    return _chat_store
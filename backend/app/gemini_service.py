@@ -13,8 +13,11 @@ automatically, allowing for natural, context-aware conversations.
 """
 
 import os
+import re
+import hashlib
 import google.generativeai as genai
-from typing import List, Dict, Optional
+from typing import Awaitable, Callable, Dict, List, Optional
+from .chat_store import get_chat_store
 
 
 # System prompt for the AI interviewer
@@ -37,6 +40,29 @@ SYSTEM_PROMPT = """You are a senior corporate HR interviewer conducting a struct
 
 Start by greeting the candidate warmly and asking the first question."""
 
+# First message of every interview: the system prompt plus the instruction to start
+# Built once at import time since it never changes between interviews
+_INITIAL_PROMPT = SYSTEM_PROMPT + "\n\nPlease greet the candidate and ask your first question."
+
+# Score extraction patterns, compiled once at import time
+# _SCORE_RE matches explicit scores like "85/100", "85 out of 100" or "85%"
+# _FALLBACK_SCORE_RE matches any standalone number between 0 and 100
+_SCORE_RE = re.compile(r'(\d+)\s*(?:out of 100|/100|%)', re.IGNORECASE)
+_FALLBACK_SCORE_RE = re.compile(r'\b([0-9]|[1-9][0-9]|100)\b')
+
+# Approximate token budget for the candidate/interviewer exchange
+# Once an interview's answers and replies add up to this many tokens (estimated
+# as characters / 4), the next reply is treated as the final one. This caps the
+# context resent on every turn, and with it per-turn latency and cost
+_TOKEN_BUDGET = 3000
+
+# Cache of first-turn greetings
+# Key: SHA-1 of the system prompt, Value: greeting text returned by Gemini
+# The greeting only depends on the system prompt, so once one interview has
+# generated it, later interviews reuse it without an API round-trip
+_GREETING_CACHE: Dict[str, str] = {}
+_GREETING_CACHE_KEY = hashlib.sha1(SYSTEM_PROMPT.encode()).hexdigest()
+
 
 class GeminiService:
     """
@@ -70,42 +96,144 @@ class GeminiService:
             raise ValueError("GEMINI_API_KEY environment variable is not set")
         
         # Configure the Gemini API client with the API key
+        # The default transport is used on purpose: the async client (all calls
+        # here are async) gets grpc_asyncio, which keeps one long-lived HTTP/2
+        # channel, so every turn multiplexes over the same TLS connection.
+        # Forcing transport="grpc" would hand the async client the synchronous
+        # transport and break every call. The clients are created once and
+        # reused because this service is a process-wide singleton (see
+        # get_gemini_service)
         genai.configure(api_key=api_key)
         
         # Create a GenerativeModel instance
-        # Use models/gemini-2.0-flash which is available and works well for conversations
-        # Alternative models: models/gemini-2.5-flash, models/gemini-2.5-pro
+        # Default to a flash-class model: much lower per-token latency than the
+        # legacy 'gemini-pro' endpoint, which matters for short Q&A turns
+        # Override with GEMINI_MODEL (e.g. models/gemini-2.5-flash, models/gemini-2.5-pro)
         # The 'models/' prefix is required for the newer API versions
-        try:
-            # Try gemini-2.0-flash first (fast and reliable)
-            self.model = genai.GenerativeModel('models/gemini-2.0-flash')
-        except Exception as e1:
-            try:
-                # Fallback to gemini-2.5-flash
-                self.model = genai.GenerativeModel('models/gemini-2.5-flash')
-            except Exception as e2:
-                # Last resort: try without prefix (older API versions)
-                self.model = genai.GenerativeModel('gemini-pro')
-        
-        # Store conversation history for each interview
-        # Key: interview_id, Value: List of message dicts
-        # Used for tracking and debugging
-        self.conversations: Dict[str, List[Dict]] = {}
+        # Note: the constructor makes no API call, so an invalid name only
+        # surfaces on the first request
+        self.model = genai.GenerativeModel(os.getenv("GEMINI_MODEL", "models/gemini-2.0-flash"))
         
         # Store active chat sessions for each interview
         # Key: interview_id, Value: Chat session object
-        # Chat sessions maintain context automatically
+        # Chat sessions maintain context automatically, and chat.history is the
+        # single source of truth for the conversation (no separate copy is kept)
         self.chat_sessions: Dict[str, any] = {}  # Store chat sessions for context
+        
+        # Approximate tokens exchanged so far in each interview
+        # Key: interview_id, Value: estimated token count (see _TOKEN_BUDGET)
+        self._token_counts: Dict[str, int] = {}
+        
+        # Optional shared history store (Redis), None unless REDIS_URL is set
+        # Lets another worker rebuild a chat session it has never seen
+        self.chat_store = get_chat_store()
+    
+    @staticmethod
+    def _serialize_history(chat) -> List[Dict]:
+        """
+        Convert a chat session's history into plain, JSON-friendly dicts.
+        
+        Args:
+            chat: Gemini chat session
+            
+        Returns:
+            List of {"role": ..., "parts": [...]} dicts accepted by start_chat()
+        """
+        return [
+            {"role": content.role, "parts": [part.text for part in content.parts]}
+            for content in chat.history
+        ]
     
-    def initialize_conversation(self, interview_id: str) -> str:
+    @staticmethod
+    def _history_tokens(history: List[Dict]) -> int:
+        """
+        Estimate the tokens exchanged in a chat history.
+        
+        Uses the same ~4 characters per token as process_answer. The first
+        exchange (initial prompt and greeting) is left out, matching the count
+        of 0 that initialize_conversation starts from.
+        
+        Args:
+            history: List of {"role": ..., "parts": [...]} dicts
+            
+        Returns:
+            Estimated token count for the _TOKEN_BUDGET check
+        """
+        return sum(len(part) for entry in history[2:] for part in entry["parts"]) // 4
+    
+    async def _persist_chat(self, interview_id: str, chat):
+        """
+        Save the chat history to the shared store, if one is configured.
+        
+        Args:
+            interview_id: The interview the chat belongs to
+            chat: Gemini chat session
+        """
+        if self.chat_store is not None:
+            await self.chat_store.save(interview_id, self._serialize_history(chat))
+    
+    async def _restore_chat(self, interview_id: str):
+        """
+        Rebuild a chat session from the shared store after a local cache miss.
+        
+        Args:
+            interview_id: The interview to restore
+            
+        Returns:
+            The restored chat session, or None if no history is stored
+        """
+        if self.chat_store is None:
+            return None
+        history = await self.chat_store.load(interview_id)
+        if history is None:
+            return None
+        chat = self.model.start_chat(history=history)
+        self.chat_sessions[interview_id] = chat
+        self._token_counts[interview_id] = self._history_tokens(history)
+        return chat
+    
+    async def seed_conversation(self, interview_id: str, messages: List[Dict]):
+        """
+        Start a chat session from another service's conversation.
+        
+        Used when an interview falls back from LM Studio mid-way, so Gemini
+        continues it with the same context instead of failing as uninitialized.
+        System messages (the prompt and any summary) become user turns, and
+        consecutive turns of the same role are merged, since Gemini expects
+        user and model turns to alternate. Trailing user messages are left
+        out: the answer being processed is sent by process_answer.
+        
+        Args:
+            interview_id: The interview to seed
+            messages: OpenAI-style {"role": ..., "content": ...} messages
+        """
+        end = len(messages)
+        while end and messages[end - 1]["role"] == "user":
+            end -= 1
+        
+        history = []
+        for message in messages[:end]:
+            role = "model" if message["role"] == "assistant" else "user"
+            if history and history[-1]["role"] == role:
+                history[-1]["parts"].append(message["content"])
+            else:
+                history.append({"role": role, "parts": [message["content"]]})
+        
+        chat = self.model.start_chat(history=history)
+        self.chat_sessions[interview_id] = chat
+        self._token_counts[interview_id] = self._history_tokens(history)
+        await self._persist_chat(interview_id, chat)
+    
+    async def initialize_conversation(self, interview_id: str) -> str:
         """
         Initialize a new interview conversation and get the greeting.
         
         This is called when an interview starts. It:
-        1. Sends the system prompt to Gemini
-        2. Gets the initial greeting/question
-        3. Sets up the chat session for context preservation
-        4. Stores the conversation history
+        1. Sets up the chat session for context preservation
+        2. Sends the system prompt to Gemini through that session (one API call),
+           or reuses the cached greeting if one was already generated
+        3. Gets the initial greeting/question
+        4. Stores the chat session, which holds the conversation history
         
         Args:
             interview_id: Unique identifier for this interview
@@ -116,53 +244,60 @@ class GeminiService:
         Raises:
             Exception: If Gemini API call fails (e.g., invalid API key, network error)
         """
-        # Combine system prompt with instruction to start the interview
-        initial_prompt = SYSTEM_PROMPT + "\n\nPlease greet the candidate and ask your first question."
-        
         try:
-            # Generate the initial greeting/question using Gemini
-            # This is a one-time generation, not a chat session yet
-            response = self.model.generate_content(initial_prompt)
-            greeting = response.text.strip()  # Remove leading/trailing whitespace
-            
-            # Initialize conversation history for this interview
-            # This tracks all messages for debugging and potential replay
-            self.conversations[interview_id] = [
-                {"role": "system", "content": SYSTEM_PROMPT},  # System instructions
-                {"role": "assistant", "content": greeting}  # First AI message
-            ]
-            
-            # Initialize chat session for context preservation
-            # Chat sessions maintain conversation history automatically
-            # This allows Gemini to remember previous exchanges
-            chat = self.model.start_chat(history=[])
-            
-            # Send the initial prompt to the chat session
-            # This sets up the context for future messages
-            chat.send_message(SYSTEM_PROMPT + "\n\nPlease greet the candidate and ask your first question.")
+            cached_greeting = _GREETING_CACHE.get(_GREETING_CACHE_KEY)
+            if cached_greeting is not None:
+                # Reuse the cached greeting and prime the chat session with the
+                # exchange it came from, so context is preserved without an API call
+                greeting = cached_greeting
+                chat = self.model.start_chat(history=[
+                    {"role": "user", "parts": [_INITIAL_PROMPT]},
+                    {"role": "model", "parts": [greeting]}
+                ])
+            else:
+                # Initialize chat session for context preservation
+                # Chat sessions maintain conversation history automatically
+                # This allows Gemini to remember previous exchanges
+                chat = self.model.start_chat(history=[])
+                
+                # Send the initial prompt to the chat session once
+                # The reply is the greeting, and the prompt stays in the chat context
+                # so we don't pay for a separate generate_content round-trip
+                response = await chat.send_message_async(_INITIAL_PROMPT)
+                greeting = response.text.strip()  # Remove leading/trailing whitespace
+                _GREETING_CACHE[_GREETING_CACHE_KEY] = greeting
             
             # Store the chat session so we can continue the conversation
             self.chat_sessions[interview_id] = chat
+            self._token_counts[interview_id] = 0
+            await self._persist_chat(interview_id, chat)
             
             return greeting
         except Exception as e:
             # Wrap the error with more context
             raise Exception(f"Failed to initialize Gemini conversation: {str(e)}")
     
-    def process_answer(self, interview_id: str, user_answer: str) -> Dict:
+    async def process_answer(
+        self,
+        interview_id: str,
+        user_answer: str,
+        on_chunk: Optional[Callable[[str], Awaitable[None]]] = None
+    ) -> Dict:
         """
         Process user's answer and get next question or end signal.
         
         This is called after the user finishes speaking. It:
-        1. Adds the user's answer to conversation history
-        2. Sends it to Gemini with full conversation context
-        3. Gets the next question or end signal
+        1. Sends the answer to Gemini through the interview's chat session
+           (the session records both the answer and the reply in its history)
+        2. Streams the reply, forwarding each chunk to on_chunk as it arrives
+        3. Gets the next question or end signal from the complete reply
         4. Extracts score if interview is ending
-        5. Updates conversation history
         
         Args:
             interview_id: Which interview this answer belongs to
             user_answer: The text transcript of what the user said
+            on_chunk: Optional coroutine called with each piece of text as
+                      Gemini produces it, so the client can show it early
             
         Returns:
             Dict with keys:
@@ -175,43 +310,53 @@ class GeminiService:
             ValueError: If interview_id doesn't exist
             Exception: If Gemini API call fails
         """
+        # Get the chat session for this interview
+        # On a local miss, try to rebuild it from the shared store (e.g. when
+        # this worker didn't start the interview)
+        chat = self.chat_sessions.get(interview_id)
+        if chat is None:
+            chat = await self._restore_chat(interview_id)
+        
         # Verify the interview was initialized
-        if interview_id not in self.conversations:
+        if chat is None:
             raise ValueError(f"Interview {interview_id} not initialized")
         
-        # Add user's answer to conversation history
-        # This is for tracking purposes
-        self.conversations[interview_id].append({
-            "role": "user",  # Message from the user
-            "content": user_answer  # What they said
-        })
-        
         try:
-            # Get or create chat session for this interview
-            # Chat sessions maintain context automatically
-            if interview_id not in self.chat_sessions:
-                # This shouldn't happen, but create if needed as fallback
-                chat = self.model.start_chat(history=[])
-                self.chat_sessions[interview_id] = chat
-            
-            # Get the chat session for this interview
-            chat = self.chat_sessions[interview_id]
-            
             # Send user's answer to the chat session
             # The chat session automatically includes previous conversation context
             # This allows Gemini to ask relevant follow-up questions
-            response = chat.send_message(user_answer)
+            # The async variant releases the event loop while waiting on the API,
+            # so other interviews keep progressing during this round-trip
+            # Streaming lets us forward the first tokens before the full reply exists
+            response = await chat.send_message_async(user_answer, stream=True)
             
-            # Extract the response text
-            response_text = response.text.strip()
+            # Accumulate the streamed chunks into the full response text
+            chunks = []
+            async for chunk in response:
+                chunk_text = chunk.text
+                chunks.append(chunk_text)
+                if on_chunk is not None:
+                    await on_chunk(chunk_text)
+            response_text = "".join(chunks).strip()
+            
+            # Share the updated history so other workers can pick up the interview
+            await self._persist_chat(interview_id, chat)
+            
+            # Track approximate tokens exchanged (about 4 characters per token)
+            token_count = self._token_counts.get(interview_id, 0) + len(user_answer) // 4 + len(response_text) // 4
+            self._token_counts[interview_id] = token_count
             
             # Check if interview should end
             # Ends if:
             # 1. Gemini explicitly says "INTERVIEW_END"
-            # 2. Conversation has reached 20 messages (safety limit)
-            if "INTERVIEW_END" in response_text.upper() or len(self.conversations[interview_id]) >= 20:
-                # Extract feedback text (remove the INTERVIEW_END marker)
-                feedback = response_text.replace("INTERVIEW_END", "").strip()
+            # 2. The exchange has used up the token budget (safety limit)
+            # The prompt asks for the exact token, so check the raw text instead of
+            # allocating an uppercased copy of every response
+            if "INTERVIEW_END" in response_text or token_count >= _TOKEN_BUDGET:
+                # Extract feedback text (everything before the trailing INTERVIEW_END marker)
+                # Falls back to the whole response if there is no text before a
+                # marker, or no marker at all (the token budget ended it)
+                feedback = response_text.rpartition("INTERVIEW_END")[0].strip() or response_text
                 
                 # Try to extract score from feedback
                 # Gemini might say "Score: 85" or "85/100" or similar
@@ -220,15 +365,14 @@ class GeminiService:
                 
                 # Look for score pattern using regex
                 # Matches patterns like "Score: 85", "85/100", "85%", etc.
-                import re
-                score_match = re.search(r'(\d+)\s*(?:out of 100|/100|%)', feedback, re.IGNORECASE)
+                score_match = _SCORE_RE.search(feedback)
                 if score_match:
                     score = float(score_match.group(1))
                 
                 # If no explicit score found, try to find any number between 0-100
                 # This is a fallback in case Gemini formats the score differently
                 if score is None:
-                    score_match = re.search(r'\b([0-9]|[1-9][0-9]|100)\b', feedback)
+                    score_match = _FALLBACK_SCORE_RE.search(feedback)
                     if score_match:
                         potential_score = float(score_match.group(1))
                         if 0 <= potential_score <= 100:  # Validate it's in valid range
@@ -238,7 +382,7 @@ class GeminiService:
                 # Longer conversations (more questions answered) get higher scores
                 # This is a fallback to ensure we always have a score
                 if score is None:
-                    score = min(70 + len(self.conversations[interview_id]) * 2, 95)
+                    score = min(70 + len(chat.history) * 2, 95)
                 
                 # Return end message with feedback and score
                 return {
@@ -248,13 +392,7 @@ class GeminiService:
                     "summary": feedback  # Summary (same as feedback in this case)
                 }
             
-            # Interview continues - add assistant response to history
-            self.conversations[interview_id].append({
-                "role": "assistant",  # Message from AI
-                "content": response_text  # The next question
-            })
-            
-            # Return next question
+            # Interview continues - return next question
             return {
                 "type": "question",  # Signal that interview continues
                 "content": response_text  # The next question text
@@ -264,9 +402,9 @@ class GeminiService:
             # Wrap error with context
             raise Exception(f"Failed to process answer with Gemini: {str(e)}")
     
-    def cleanup(self, interview_id: str):
+    async def cleanup(self, interview_id: str):
         """
-        Clean up conversation history and chat session for an interview.
+        Clean up the chat session for an interview.
         
         This is called when an interview ends to free up memory.
         Important for preventing memory leaks in long-running servers.
@@ -274,13 +412,13 @@ class GeminiService:
         Args:
             interview_id: The interview to clean up
         """
-        # Remove conversation history
-        if interview_id in self.conversations:
-            del self.conversations[interview_id]
+        # Remove chat session (and with it the conversation history)
+        self.chat_sessions.pop(interview_id, None)
+        self._token_counts.pop(interview_id, None)
         
-        # Remove chat session
-        if interview_id in self.chat_sessions:
-            del self.chat_sessions[interview_id]
+        # Remove the shared copy as well
+        if self.chat_store is not None:
+            await self.chat_store.delete(interview_id)
 
 
 # Global Gemini service instance (lazy initialization)
@@ -17,11 +17,54 @@ The state machine prevents issues like:
 - Sending questions before previous question is complete
 """
 
+import time
+import threading
+from collections import deque
 from enum import Enum
 from typing import Dict, Optional
 from datetime import datetime
 from .models import InterviewState
 
+# Maximum number of messages kept in a session's conversation history
+# Older messages are dropped automatically so abandoned sessions stay small
+MAX_HISTORY_MESSAGES = 50
+
+
+# Valid transitions from each state
+# This maps each state to the set of states it can transition to
+# Built once at import time; frozensets give O(1) membership checks
+_VALID_TRANSITIONS: Dict[InterviewState, frozenset] = {
+    InterviewState.AI_ASKING: frozenset({
+        InterviewState.AI_SPEAKING,  # Can start speaking
+        InterviewState.PROCESSING_WITH_GEMINI  # Or process if question already exists
+    }),
+    InterviewState.AI_SPEAKING: frozenset({InterviewState.WAITING_FOR_USER}),  # After speaking, wait for user
+    InterviewState.WAITING_FOR_USER: frozenset({InterviewState.USER_SPEAKING}),  # User starts speaking
+    InterviewState.USER_SPEAKING: frozenset({InterviewState.SILENCE_DETECTED}),  # User stops speaking
+    InterviewState.SILENCE_DETECTED: frozenset({InterviewState.PROCESSING_WITH_GEMINI}),  # Process the answer
+    InterviewState.PROCESSING_WITH_GEMINI: frozenset({
+        InterviewState.NEXT_QUESTION,  # Continue with next question
+        InterviewState.INTERVIEW_ENDED  # Or end the interview
+    }),
+    InterviewState.NEXT_QUESTION: frozenset({InterviewState.AI_SPEAKING}),  # Loop back to speaking
+}
+
+
+def format_ts(entry: Dict) -> str:
+    """
+    Format a history entry's timestamp as an ISO 8601 string.
+    
+    History entries store a Unix timestamp, which is cheap to record;
+    formatting is deferred to the (rare) places that display it.
+    
+    Args:
+        entry: A message dict from InterviewSession.conversation_history
+        
+    Returns:
+        str: The local time of the message in ISO format
+    """
+    return datetime.fromtimestamp(entry["timestamp"]).isoformat()
+
 
 class InterviewSession:
     """
@@ -37,6 +80,10 @@ class InterviewSession:
     flows correctly from start to finish.
     """
     
+    # Fixed attribute set: no per-instance __dict__, which keeps sessions small
+    # and attribute access fast with many interviews running at once
+    __slots__ = ("interview_id", "state", "created_at", "conversation_history", "question_count", "_lock")
+    
     def __init__(self, interview_id: str):
         """
         Initialize a new interview session.
@@ -47,9 +94,10 @@ class InterviewSession:
         self.interview_id = interview_id  # Unique ID for this interview
         self.state = InterviewState.AI_ASKING  # Start in initial state
         self.created_at = datetime.now()  # When this session was created
-        self.conversation_history: list = []  # Store all messages for context
+        self.conversation_history: deque = deque(maxlen=MAX_HISTORY_MESSAGES)  # Most recent messages for context
         self.question_count = 0  # Track how many questions have been asked
-        
+        self._lock = threading.RLock()  # Makes validate+assign in transition_to atomic
+    
     def transition_to(self, new_state: InterviewState) -> bool:
         """
         Transition to a new state if the transition is valid.
@@ -68,43 +116,24 @@ class InterviewSession:
         - NEXT_QUESTION -> AI_SPEAKING (loops back)
         - Any state -> INTERVIEW_ENDED (can end from anywhere)
         
+        This method is thread-safe: the validity check and the state update
+        happen under the session's lock, so concurrent callers can't both
+        apply a transition from the same starting state.
+        
         Args:
             new_state: The state to transition to
             
         Returns:
             bool: True if transition was successful, False if invalid
         """
-        # Define valid transitions from each state
-        # This dictionary maps each state to a list of states it can transition to
-        valid_transitions = {
-            InterviewState.AI_ASKING: [
-                InterviewState.AI_SPEAKING,  # Can start speaking
-                InterviewState.PROCESSING_WITH_GEMINI  # Or process if question already exists
-            ],
-            InterviewState.AI_SPEAKING: [InterviewState.WAITING_FOR_USER],  # After speaking, wait for user
-            InterviewState.WAITING_FOR_USER: [InterviewState.USER_SPEAKING],  # User starts speaking
-            InterviewState.USER_SPEAKING: [InterviewState.SILENCE_DETECTED],  # User stops speaking
-            InterviewState.SILENCE_DETECTED: [InterviewState.PROCESSING_WITH_GEMINI],  # Process the answer
-            InterviewState.PROCESSING_WITH_GEMINI: [
-                InterviewState.NEXT_QUESTION,  # Continue with next question
-                InterviewState.INTERVIEW_ENDED  # Or end the interview
-            ],
-            InterviewState.NEXT_QUESTION: [InterviewState.AI_SPEAKING],  # Loop back to speaking
-        }
-        
-        # INTERVIEW_ENDED is a special state - can be reached from any state
-        # This allows graceful termination even if something goes wrong
-        if new_state == InterviewState.INTERVIEW_ENDED:
-            self.state = new_state
-            return True
-            
-        # Check if the requested transition is valid
-        allowed = valid_transitions.get(self.state, [])
-        if new_state in allowed:
-            self.state = new_state
-            return True
-        # Invalid transition - return False and don't change state
-        return False
+        with self._lock:
+            # INTERVIEW_ENDED is a special state - can be reached from any state
+            # This allows graceful termination even if something goes wrong
+            if new_state is InterviewState.INTERVIEW_ENDED or new_state in _VALID_TRANSITIONS.get(self.state, frozenset()):
+                self.state = new_state
+                return True
+            # Invalid transition - return False and don't change state
+            return False
     
     def add_to_history(self, role: str, content: str):
         """
@@ -122,7 +151,7 @@ class InterviewSession:
         self.conversation_history.append({
             "role": role,  # "user" or "assistant"
             "content": content,  # The actual message text
-            "timestamp": datetime.now().isoformat()  # ISO format timestamp
+            "timestamp": time.time()  # Unix time; see format_ts for an ISO string
         })
     
     def increment_question_count(self):
@@ -156,6 +185,9 @@ class InterviewStateManager:
         Sessions are stored in memory (not persisted to database).
         """
         self.sessions: Dict[str, InterviewSession] = {}  # Map interview_id -> InterviewSession
+        # Serializes writers (create/remove). Reads stay lock-free: a single
+        # dict.get is atomic, so concurrent get_session calls never wait
+        self._lock = threading.Lock()
     
     def create_session(self, interview_id: str) -> InterviewSession:
         """
@@ -167,8 +199,9 @@ class InterviewStateManager:
         Returns:
             InterviewSession: The newly created session instance
         """
-        session = InterviewSession(interview_id)
-        self.sessions[interview_id] = session  # Store in dictionary
+        with self._lock:
+            session = InterviewSession(interview_id)
+            self.sessions[interview_id] = session  # Store in dictionary
         return session
     
     def get_session(self, interview_id: str) -> Optional[InterviewSession]:
@@ -193,8 +226,8 @@ class InterviewStateManager:
         Args:
             interview_id: The ID of the session to remove
         """
-        if interview_id in self.sessions:
-            del self.sessions[interview_id]  # Remove from dictionary
+        with self._lock:
+            self.sessions.pop(interview_id, None)  # Remove from dictionary
 
 
 # Global state manager instance
@@ -12,17 +12,23 @@ This service:
 - Detects when interviews should end
 - Extracts scores and feedback from AI responses
 
-The service uses HTTP requests to communicate with LM Studio's OpenAI-compatible
-API endpoint, typically running on localhost:1234.
+The service uses an async HTTP client (httpx) to communicate with LM Studio's
+OpenAI-compatible API endpoint, typically running on localhost:1234, so the
+event loop keeps serving other interviews while LM Studio generates a reply.
 """
 
 import os
+import json
+import asyncio
+import time
 import logging
 import re
-from typing import List, Dict, Optional
-import requests
-from requests.adapters import HTTPAdapter
-from urllib3.util.retry import Retry
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Awaitable, Callable, List, Dict, Optional
+import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +53,87 @@ SYSTEM_PROMPT = """You are a senior corporate HR interviewer conducting a struct
 
 Start by greeting the candidate warmly and asking the first question."""
 
+# Opening messages of every interview, built once at import time
+# The dicts are shared by all conversations, so they must never be mutated
+_INITIAL_MESSAGES = (
+    {"role": "system", "content": SYSTEM_PROMPT},
+    {"role": "user", "content": "Please greet the candidate and ask your first question."}
+)
+
+# Limits on stored conversations
+# MAX_SESSIONS: conversations kept in memory; the least recently used is evicted beyond this
+# SESSION_EXPIRE_SECONDS: conversations untouched for this long are dropped
+# (covers interviews whose client disconnected without cleanup)
+MAX_SESSIONS = int(os.getenv("LM_STUDIO_MAX_SESSIONS", "5000"))
+SESSION_EXPIRE_SECONDS = int(os.getenv("LM_STUDIO_SESSION_EXPIRE", "3600"))
+
+# Maximum number of recent user/assistant messages sent with each request
+# The system prompt and any summary are always sent in addition to these.
+# Payload size dominates LM Studio latency on long interviews, so older turns
+# are summarized (see SUMMARIZE_AFTER_TOKENS) before they'd fall out of this window
+MAX_CONTEXT_MESSAGES = 16
+
+# Older turns are folded into a short summary once a conversation's estimated
+# size passes SUMMARIZE_AFTER_TOKENS; the SUMMARY_KEEP_RECENT latest messages
+# stay verbatim. Message lengths vary widely, so tokens are a better measure
+# of the model's context use than a message count
+SUMMARIZE_AFTER_TOKENS = 1500
+SUMMARY_KEEP_RECENT = 6
+
+# Detected model names, cached across restarts and keyed by LM Studio base URL
+# Lets a restart skip the /v1/models detection request
+_MODEL_CACHE_PATH = Path(os.getenv("XDG_CACHE_HOME", Path.home() / ".cache")) / "mockinterview_lmstudio_model.json"
+
+# Model selection priority: (substring of the lowercased model id, score)
+# llama-3-8b-instruct is best for interviews, then any instruction-tuned model;
+# models matching nothing score 0 and the first one wins as a fallback
+MODEL_PRIORITY = (("llama-3-8b-instruct", 2), ("instruct", 1))
+
+# Upper bound on generated tokens per reply
+# An interview question or the final feedback fits comfortably in this
+MAX_RESPONSE_TOKENS = 400
+
+# Score extraction patterns, compiled once at import time
+# _SCORE_RE_EXPLICIT matches explicit scores like "85/100", "85 out of 100" or "85%"
+# _SCORE_RE_FALLBACK matches any standalone number between 0 and 100
+_SCORE_RE_EXPLICIT = re.compile(r'(\d+)\s*(?:out of 100|/100|%)', re.IGNORECASE)
+_SCORE_RE_FALLBACK = re.compile(r'\b([0-9]|[1-9][0-9]|100)\b')
+
+SUMMARY_PROMPT = """Summarize the following interview transcript in a few sentences.
+Keep the questions asked, the key points of the candidate's answers, and any
+strengths or weaknesses observed. Do not add commentary."""
+
+
+def _extract_score(feedback: str, history_len: int) -> float:
+    """
+    Extract the interview score from LM Studio's final feedback.
+    
+    Tries each source in turn and returns as soon as one gives a score:
+    1. An explicit score such as "85/100", "85 out of 100" or "85%"
+    2. Any standalone number between 0 and 100 (in case LM Studio formats
+       the score differently)
+    3. A default based on conversation length - longer conversations (more
+       questions answered) get higher scores - so there is always a score
+    
+    Args:
+        feedback: The feedback text (without the INTERVIEW_END marker)
+        history_len: Number of messages in the conversation
+        
+    Returns:
+        float: The score
+    """
+    score_match = _SCORE_RE_EXPLICIT.search(feedback)
+    if score_match:
+        return float(score_match.group(1))
+    
+    score_match = _SCORE_RE_FALLBACK.search(feedback)
+    if score_match:
+        potential_score = float(score_match.group(1))
+        if 0 <= potential_score <= 100:  # Validate it's in valid range
+            return potential_score
+    
+    return float(min(70 + history_len * 2, 95))
+
 
 class LMStudioService:
     """
@@ -70,9 +157,11 @@ class LMStudioService:
         - LM_STUDIO_BASE_URL: Base URL for LM Studio API (default: http://localhost:1234)
         - LM_STUDIO_MODEL: Explicit model name (optional, will auto-detect if not set)
         
+        No requests are made here: model detection and the connection test
+        run lazily on first use (see _ensure_ready).
+        
         Raises:
             ValueError: If LM Studio base URL is invalid
-            ConnectionError: If LM Studio is not reachable
         """
         # Get base URL from environment variable
         # Default to localhost:1234 which is LM Studio's default port
@@ -82,55 +171,148 @@ class LMStudioService:
         if not self.base_url.startswith(("http://", "https://")):
             raise ValueError(f"Invalid LM_STUDIO_BASE_URL: {self.base_url}. Must start with http:// or https://")
         
-        # Create HTTP session with retry strategy
-        # This helps handle temporary connection issues gracefully
-        self.session = requests.Session()
-        retry_strategy = Retry(
-            total=2,  # Maximum 2 retries
-            backoff_factor=0.5,  # Wait 0.5s, 1s between retries
-            status_forcelist=[429, 500, 502, 503, 504],  # Retry on these status codes
-            allowed_methods=["POST", "GET"]  # Only retry POST and GET requests
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
-        
         # Set timeout for requests (5 seconds for connection, 30 seconds for response)
         # This prevents hanging if LM Studio is slow or unresponsive
-        self.timeout = (5, 30)
+        self.timeout = httpx.Timeout(30.0, connect=5.0)
+        
+        # Create the async HTTP client
+        # The transport retries failed connection attempts, and its pool is large
+        # enough that concurrent interviews reuse keep-alive connections instead
+        # of opening a new one per request
+        transport = httpx.AsyncHTTPTransport(
+            retries=2,  # Maximum 2 retries on connection errors
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=128)
+        )
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=self.timeout,
+            transport=transport,
+            # Request bodies are pre-encoded with orjson, so Content-Type is set here
+            headers={
+                "Connection": "keep-alive",
+                "Content-Type": "application/json",
+                "Accept": "application/json"
+            }
+        )
         
         # Try to get model name from environment variable
-        # If not set, we'll auto-detect it
+        # If not set, use the one detected on a previous run, or auto-detect it on first use
         self.model_name = os.getenv("LM_STUDIO_MODEL")
-        
-        # Auto-detect model name if not explicitly set
+        self._model_from_cache = False
         if not self.model_name:
-            try:
-                self.model_name = self._detect_model()
-                logger.info(f"Auto-detected LM Studio model: {self.model_name}")
-            except Exception as e:
-                logger.warning(f"Failed to auto-detect model: {e}. Using default.")
-                # Use a default model name (LM Studio typically uses the loaded model name)
-                # This might need adjustment based on actual LM Studio behavior
-                self.model_name = "local-model"
+            self.model_name = self._load_cached_model()
+            self._model_from_cache = self.model_name is not None
+        
+        # Set once LM Studio has been reached and the model name is known
+        self._ready = False
+        self._init_lock = asyncio.Lock()
         
         # Store conversation history for each interview
         # Key: interview_id, Value: List of message dicts with role and content
         # Format: [{"role": "system", "content": "..."}, {"role": "user", "content": "..."}, ...]
         # This maintains context across multiple API calls
-        self.conversations: Dict[str, List[Dict]] = {}
+        # Ordered by last use so the least recently used interview is evicted first
+        self.conversations: "OrderedDict[str, List[Dict]]" = OrderedDict()
+        self._last_used: Dict[str, float] = {}  # interview_id -> time.monotonic() of last use
+        # Bookkeeping on the dicts is locked so the service stays safe to use from worker threads
+        self._conversations_lock = threading.Lock()
+    
+    async def _ensure_ready(self):
+        """
+        Verify LM Studio is reachable and pick the model, once.
         
-        # Test connection to LM Studio (non-blocking - will fail gracefully if not available)
+        Runs on first use instead of in __init__ so creating the service never
+        blocks on LM Studio. If LM Studio is unreachable, the ConnectionError
+        propagates (letting the unified service fall back to Gemini) and the
+        check is retried on the next call.
+        
+        Raises:
+            ConnectionError: If LM Studio is not reachable
+        """
+        if self._ready:
+            return
+        async with self._init_lock:
+            # Another interview may have finished the check while we waited
+            if self._ready:
+                return
+            
+            await self._test_connection()
+            
+            # Auto-detect model name if not explicitly set
+            if not self.model_name:
+                try:
+                    self.model_name = await self._detect_model()
+                    logger.info(f"Auto-detected LM Studio model: {self.model_name}")
+                    # File I/O runs in a worker thread to keep the event loop free
+                    await asyncio.to_thread(self._save_cached_model, self.model_name)
+                except Exception as e:
+                    logger.warning(f"Failed to auto-detect model: {e}. Using default.")
+                    # Use a default model name (LM Studio typically uses the loaded model name)
+                    # This might need adjustment based on actual LM Studio behavior
+                    self.model_name = "local-model"
+            
+            self._ready = True
+            logger.info(f"LM Studio service ready at {self.base_url} with model {self.model_name}")
+    
+    def _read_model_cache(self) -> Dict[str, str]:
+        """
+        Read the model cache file.
+        
+        Returns:
+            Dict mapping base URL to model name (empty if missing or unreadable)
+        """
+        try:
+            return json.loads(_MODEL_CACHE_PATH.read_text())
+        except (OSError, ValueError):
+            return {}
+    
+    def _load_cached_model(self) -> Optional[str]:
+        """
+        Get the model detected for this base URL on a previous run.
+        
+        Returns:
+            The cached model name, or None if there is none
+        """
+        model_name = self._read_model_cache().get(self.base_url)
+        if model_name:
+            logger.info(f"Using cached LM Studio model: {model_name}")
+        return model_name
+    
+    def _save_cached_model(self, model_name: Optional[str]):
+        """
+        Store (or with None, remove) the model name for this base URL.
+        
+        Cache write failures are logged and ignored - detection simply runs
+        again on the next start.
+        
+        Args:
+            model_name: The detected model name, or None to drop the entry
+        """
+        cache = self._read_model_cache()
+        if model_name is None:
+            cache.pop(self.base_url, None)
+        else:
+            cache[self.base_url] = model_name
         try:
-            self._test_connection()
-            logger.info(f"LM Studio service initialized successfully at {self.base_url} with model {self.model_name}")
-        except Exception as e:
-            logger.warning(f"LM Studio connection test failed at {self.base_url}: {e}")
-            logger.warning("LM Studio service will be available but may fail on first use. Make sure LM Studio is running.")
-            # Don't raise - allow service to be created, but it will fail on first API call
-            # This allows the fallback mechanism to work properly
+            _MODEL_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            _MODEL_CACHE_PATH.write_text(json.dumps(cache))
+        except OSError as e:
+            logger.warning(f"Failed to write LM Studio model cache: {e}")
     
-    def _detect_model(self) -> str:
+    async def _forget_cached_model(self):
+        """
+        Drop a cached model name that LM Studio rejected.
+        
+        The next request re-runs detection. Only done once per process, so a
+        genuinely failing request is not retried forever.
+        """
+        logger.warning(f"Cached LM Studio model {self.model_name} was rejected, re-detecting")
+        self._model_from_cache = False
+        self.model_name = None
+        self._ready = False
+        await asyncio.to_thread(self._save_cached_model, None)
+    
+    async def _detect_model(self) -> str:
         """
         Auto-detect available model from LM Studio.
         
@@ -147,14 +329,11 @@ class LMStudioService:
         """
         try:
             # Query LM Studio's models endpoint (OpenAI-compatible)
-            response = self.session.get(
-                f"{self.base_url}/v1/models",
-                timeout=self.timeout
-            )
+            response = await self._client.get("/v1/models")
             response.raise_for_status()
             
             # Parse response (OpenAI-compatible format)
-            data = response.json()
+            data = orjson.loads(response.content)
             models = data.get("data", [])
             
             if not models:
@@ -164,34 +343,24 @@ class LMStudioService:
             model_ids = [m.get("id") for m in models]
             logger.info(f"Available models in LM Studio: {model_ids}")
             
-            # Priority order for model selection:
-            # 1. llama-3-8b-instruct (best for interviews)
-            # 2. Any other instruction-tuned model (instruct in name)
-            # 3. First available model as fallback
-            
-            # First, try to find llama-3-8b-instruct specifically
+            # Score every model in a single pass using MODEL_PRIORITY
+            # Ties keep the earlier model, so with no matches the first one is used
+            best_id, best_score = None, -1
             for model in models:
                 model_id = model.get("id", "")
-                if "llama-3-8b-instruct" in model_id.lower():
-                    logger.info(f"Selected model: {model_id} (llama-3-8b-instruct)")
-                    return model_id
+                model_id_lower = model_id.lower()
+                score = max((s for token, s in MODEL_PRIORITY if token in model_id_lower), default=0)
+                if score > best_score:
+                    best_id, best_score = model_id, score
             
-            # If not found, try any instruction-tuned model
-            for model in models:
-                model_id = model.get("id", "")
-                if "instruct" in model_id.lower():
-                    logger.info(f"Selected model: {model_id} (instruction-tuned)")
-                    return model_id
-            
-            # Fallback to first available model
-            model_id = models[0].get("id", "local-model")
-            logger.info(f"Selected model: {model_id} (first available)")
+            model_id = best_id or "local-model"
+            logger.info(f"Selected model: {model_id} (priority score {best_score})")
             return model_id
             
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             raise Exception(f"Failed to query models endpoint: {str(e)}")
     
-    def _test_connection(self):
+    async def _test_connection(self):
         """
         Test connection to LM Studio by making a simple request.
         
@@ -203,19 +372,163 @@ class LMStudioService:
         """
         try:
             # Try to get models list as a connection test
-            response = self.session.get(
-                f"{self.base_url}/v1/models",
-                timeout=(5, 10)  # Shorter timeout for connection test
+            response = await self._client.get(
+                "/v1/models",
+                timeout=httpx.Timeout(10.0, connect=5.0)  # Shorter timeout for connection test
             )
             response.raise_for_status()
-        except requests.exceptions.ConnectionError:
+        except httpx.ConnectError:
             raise ConnectionError(f"Cannot connect to LM Studio at {self.base_url}. Is it running?")
-        except requests.exceptions.Timeout:
+        except httpx.TimeoutException:
             raise ConnectionError(f"LM Studio at {self.base_url} did not respond in time.")
-        except requests.exceptions.RequestException as e:
+        except httpx.HTTPError as e:
             raise ConnectionError(f"Error connecting to LM Studio: {str(e)}")
     
-    def initialize_conversation(self, interview_id: str) -> str:
+    def _get_conversation(self, interview_id: str) -> Optional[List[Dict]]:
+        """
+        Get an interview's conversation and mark it as recently used.
+        
+        Args:
+            interview_id: The interview to look up
+            
+        Returns:
+            The conversation's message list, or None if not found
+        """
+        with self._conversations_lock:
+            conversation = self.conversations.get(interview_id)
+            if conversation is not None:
+                self.conversations.move_to_end(interview_id)
+                self._last_used[interview_id] = time.monotonic()
+            return conversation
+    
+    def _store_conversation(self, interview_id: str, messages: List[Dict]):
+        """
+        Store a conversation and evict stale or excess ones.
+        
+        Eviction runs here (on insert) instead of in a background task:
+        oldest entries are dropped while there are more than MAX_SESSIONS or
+        they have been idle longer than SESSION_EXPIRE_SECONDS.
+        
+        Args:
+            interview_id: The interview the conversation belongs to
+            messages: The conversation's message list
+        """
+        with self._conversations_lock:
+            now = time.monotonic()
+            self.conversations[interview_id] = messages
+            self.conversations.move_to_end(interview_id)
+            self._last_used[interview_id] = now
+            
+            while self.conversations:
+                oldest_id = next(iter(self.conversations))
+                if len(self.conversations) <= MAX_SESSIONS and now - self._last_used[oldest_id] <= SESSION_EXPIRE_SECONDS:
+                    break
+                self.conversations.popitem(last=False)
+                self._last_used.pop(oldest_id, None)
+                logger.info(f"Evicted idle LM Studio conversation for interview {oldest_id}")
+    
+    @staticmethod
+    def _context_messages(conversation: List[Dict]) -> List[Dict]:
+        """
+        Select the messages to send to LM Studio for the next reply.
+        
+        The leading system messages (the prompt and any summary of earlier
+        turns) are always kept, followed by at most MAX_CONTEXT_MESSAGES of
+        the most recent messages. Normally _summarize_old_turns keeps
+        conversations inside the window; this only truncates if a summary
+        request failed.
+        
+        Short conversations are returned as is, not copied: the payload is
+        only serialized, never modified, so a copy per answer is wasted work.
+        
+        Args:
+            conversation: Full conversation history (system prompt first)
+            
+        Returns:
+            List of messages for the request payload
+        """
+        head = 1
+        while head < len(conversation) and conversation[head]["role"] == "system":
+            head += 1
+        if len(conversation) - head <= MAX_CONTEXT_MESSAGES:
+            return conversation
+        return conversation[:head] + conversation[-MAX_CONTEXT_MESSAGES:]
+    
+    @staticmethod
+    def _estimate_tokens(messages: List[Dict]) -> int:
+        """
+        Estimate the number of tokens in a list of messages.
+        
+        Uses about 1.3 tokens per word, which is close enough for deciding
+        when to summarize without depending on the model's tokenizer.
+        
+        Args:
+            messages: Messages with "content" strings
+            
+        Returns:
+            Estimated token count
+        """
+        return int(sum(len(m["content"].split()) for m in messages) * 1.3)
+    
+    async def _summarize_old_turns(self, interview_id: str):
+        """
+        Replace older turns of a long conversation with a short summary.
+        
+        Once a conversation's estimated size exceeds SUMMARIZE_AFTER_TOKENS,
+        or it would no longer fit in the MAX_CONTEXT_MESSAGES window (so no
+        turn is ever dropped unsummarized), everything between the system prompt and the SUMMARY_KEEP_RECENT most
+        recent messages is summarized by LM Studio and replaced with a single
+        system message. This keeps request payloads small without losing the
+        context of earlier answers.
+        
+        Summarization is best effort: if the request fails, the conversation
+        is left as is and the next reply uses the full history.
+        
+        Args:
+            interview_id: The interview whose conversation to compact
+        """
+        conversation = self.conversations.get(interview_id)
+        if conversation is None or len(conversation) <= SUMMARY_KEEP_RECENT + 2:
+            return  # Nothing worth folding
+        if (
+            len(conversation) <= MAX_CONTEXT_MESSAGES + 1
+            and self._estimate_tokens(conversation) <= SUMMARIZE_AFTER_TOKENS
+        ):
+            return
+        
+        cut = len(conversation) - SUMMARY_KEEP_RECENT
+        old_turns = conversation[1:cut]
+        
+        # Render the turns as a plain transcript for the summarization request
+        speakers = {"assistant": "Interviewer", "user": "Candidate"}
+        transcript = "\n".join(
+            f"{speakers.get(m['role'], 'Notes')}: {m['content']}" for m in old_turns
+        )
+        
+        try:
+            response = await self._client.post(
+                "/v1/chat/completions",
+                content=orjson.dumps({
+                    "model": self.model_name,
+                    "messages": [
+                        {"role": "system", "content": SUMMARY_PROMPT},
+                        {"role": "user", "content": transcript}
+                    ],
+                    "temperature": 0.2,  # Keep the summary factual
+                    "max_tokens": MAX_RESPONSE_TOKENS,
+                    "stream": False
+                })
+            )
+            response.raise_for_status()
+            summary = orjson.loads(response.content)["choices"][0]["message"]["content"].strip()
+        except (httpx.HTTPError, KeyError, IndexError, ValueError) as e:
+            logger.warning(f"Failed to summarize conversation for interview {interview_id}: {e}")
+            return
+        
+        # Replace the old turns in place so the stored conversation is updated
+        conversation[1:cut] = [{"role": "system", "content": f"Summary of earlier turns: {summary}"}]
+    
+    async def initialize_conversation(self, interview_id: str) -> str:
         """
         Initialize a new interview conversation and get the greeting.
         
@@ -231,37 +544,36 @@ class LMStudioService:
             str: The greeting/question text from LM Studio
             
         Raises:
-            Exception: If LM Studio API call fails (e.g., connection error, timeout)
+            ConnectionError: If LM Studio is unreachable or the request fails
+            TimeoutError: If LM Studio does not respond in time
+            Exception: If LM Studio returns an invalid response
         """
+        await self._ensure_ready()
+        
         # Prepare the initial messages
         # OpenAI-compatible format requires messages array with role and content
-        messages = [
-            {"role": "system", "content": SYSTEM_PROMPT},
-            {"role": "user", "content": "Please greet the candidate and ask your first question."}
-        ]
+        messages = _INITIAL_MESSAGES
         
         try:
             # Make API call to LM Studio
             # Using OpenAI-compatible endpoint format
-            # Using max_tokens: -1 for unlimited tokens (LM Studio supports this)
             # This matches the curl command format provided by the user
-            response = self.session.post(
-                f"{self.base_url}/v1/chat/completions",
-                json={
+            response = await self._client.post(
+                "/v1/chat/completions",
+                content=orjson.dumps({
                     "model": self.model_name,
                     "messages": messages,
                     "temperature": 0.7,  # Moderate creativity
-                    "max_tokens": -1,  # Unlimited tokens (LM Studio supports this)
+                    "max_tokens": MAX_RESPONSE_TOKENS,  # Bounded so a runaway reply can't stall the turn
                     "stream": False  # We want complete response, not streaming
-                },
-                timeout=self.timeout
+                })
             )
             
             # Check for HTTP errors
             response.raise_for_status()
             
             # Parse response (OpenAI-compatible format)
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Extract the greeting text from the response
             # OpenAI format: choices[0].message.content
@@ -272,37 +584,50 @@ class LMStudioService:
             
             # Initialize conversation history for this interview
             # This tracks all messages for context in future calls
-            self.conversations[interview_id] = [
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {"role": "user", "content": "Please greet the candidate and ask your first question."},
-                {"role": "assistant", "content": greeting}
-            ]
+            self._store_conversation(interview_id, [*_INITIAL_MESSAGES, {"role": "assistant", "content": greeting}])
             
             return greeting
             
-        except requests.exceptions.ConnectionError as e:
-            raise Exception(f"Failed to connect to LM Studio: {str(e)}")
-        except requests.exceptions.Timeout as e:
-            raise Exception(f"LM Studio request timed out: {str(e)}")
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Failed to initialize LM Studio conversation: {str(e)}")
+        # Network-level failures are raised as ConnectionError/TimeoutError so the
+        # unified service can tell them apart from bugs and fall back to Gemini
+        except httpx.ConnectError as e:
+            raise ConnectionError(f"Failed to connect to LM Studio: {str(e)}")
+        except httpx.TimeoutException as e:
+            raise TimeoutError(f"LM Studio request timed out: {str(e)}")
+        except httpx.HTTPStatusError as e:
+            # A cached model name goes stale when a different model is loaded;
+            # LM Studio rejects it, so re-detect and retry once
+            if self._model_from_cache and e.response.status_code in (400, 404):
+                await self._forget_cached_model()
+                return await self.initialize_conversation(interview_id)
+            raise ConnectionError(f"Failed to initialize LM Studio conversation: {str(e)}")
+        except httpx.HTTPError as e:
+            raise ConnectionError(f"Failed to initialize LM Studio conversation: {str(e)}")
         except (KeyError, IndexError) as e:
             raise Exception(f"Invalid response format from LM Studio: {str(e)}")
     
-    def process_answer(self, interview_id: str, user_answer: str) -> Dict:
+    async def process_answer(
+        self,
+        interview_id: str,
+        user_answer: str,
+        on_chunk: Optional[Callable[[str], Awaitable[None]]] = None
+    ) -> Dict:
         """
         Process user's answer and get next question or end signal.
         
         This is called after the user finishes speaking. It:
         1. Adds the user's answer to conversation history
-        2. Sends it to LM Studio with full conversation context
-        3. Gets the next question or end signal
-        4. Extracts score if interview is ending
-        5. Updates conversation history
+        2. Sends it to LM Studio with the system prompt and recent conversation context
+        3. Streams the reply, forwarding each piece of text to on_chunk as it arrives
+        4. Gets the next question or end signal from the complete reply
+        5. Extracts score if interview is ending
+        6. Updates conversation history
         
         Args:
             interview_id: Which interview this answer belongs to
             user_answer: The text transcript of what the user said
+            on_chunk: Optional coroutine called with each piece of text as
+                      LM Studio produces it, so the client can show it early
             
         Returns:
             Dict with keys:
@@ -313,88 +638,87 @@ class LMStudioService:
             
         Raises:
             ValueError: If interview_id doesn't exist
-            Exception: If LM Studio API call fails
+            ConnectionError: If LM Studio is unreachable or the request fails
+            TimeoutError: If LM Studio does not respond in time
+            Exception: If LM Studio returns an invalid response
         """
+        await self._ensure_ready()
+        
         # Verify the interview was initialized
-        if interview_id not in self.conversations:
+        conversation = self._get_conversation(interview_id)
+        if conversation is None:
             raise ValueError(f"Interview {interview_id} not initialized")
         
         # Add user's answer to conversation history
         # This maintains context for the next API call
-        self.conversations[interview_id].append({
+        conversation.append({
             "role": "user",
             "content": user_answer
         })
         
+        # Fold older turns into a summary before building the payload
+        await self._summarize_old_turns(interview_id)
+        
         try:
             # Prepare messages for API call
-            # Include full conversation history for context
+            # Include the system prompt and recent conversation history for context
             # LM Studio will use this to generate contextually relevant responses
-            messages = self.conversations[interview_id].copy()
+            messages = self._context_messages(conversation)
             
-            # Make API call to LM Studio
-            # Using max_tokens: -1 for unlimited tokens (LM Studio supports this)
-            # This matches the curl command format provided by the user
-            response = self.session.post(
-                f"{self.base_url}/v1/chat/completions",
-                json={
+            # Make a streaming API call to LM Studio
+            # The reply arrives as server-sent events, one "data: {...}" line per
+            # delta, terminated by "data: [DONE]"
+            chunks = []
+            async with self._client.stream(
+                "POST",
+                "/v1/chat/completions",
+                content=orjson.dumps({
                     "model": self.model_name,
                     "messages": messages,
                     "temperature": 0.7,
-                    "max_tokens": -1,  # Unlimited tokens (LM Studio supports this)
-                    "stream": False
-                },
-                timeout=self.timeout
-            )
-            
-            # Check for HTTP errors
-            response.raise_for_status()
-            
-            # Parse response
-            data = response.json()
-            
-            if "choices" not in data or not data["choices"]:
-                raise Exception("Invalid response format from LM Studio: no choices")
+                    "max_tokens": MAX_RESPONSE_TOKENS,  # Bounded so a runaway reply can't stall the turn
+                    "stream": True
+                })
+            ) as response:
+                # Check for HTTP errors
+                response.raise_for_status()
+                
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue  # Blank separators and SSE comments
+                    data = line[6:]
+                    if data == "[DONE]":
+                        break
+                    
+                    # OpenAI streaming format: choices[0].delta.content
+                    choices = orjson.loads(data).get("choices")
+                    if not choices:
+                        continue
+                    delta = choices[0].get("delta", {}).get("content")
+                    if delta:
+                        chunks.append(delta)
+                        if on_chunk is not None:
+                            await on_chunk(delta)
             
-            # Extract response text
-            response_text = data["choices"][0]["message"]["content"].strip()
+            # Full response text for the end check and conversation history
+            response_text = "".join(chunks).strip()
+            if not response_text:
+                raise Exception("Invalid response format from LM Studio: empty response")
             
             # Check if interview should end
-            # Ends if:
-            # 1. LM Studio explicitly says "INTERVIEW_END"
-            # 2. Conversation has reached 20 messages (safety limit)
-            if "INTERVIEW_END" in response_text.upper() or len(self.conversations[interview_id]) >= 20:
-                # Extract feedback text (remove the INTERVIEW_END marker)
-                feedback = response_text.replace("INTERVIEW_END", "").strip()
+            # Only LM Studio decides, by saying "INTERVIEW_END" (exact token, as the system
+            # prompt asks). Long conversations are summarized instead of being cut off
+            if "INTERVIEW_END" in response_text:
+                # Extract feedback text (everything before the trailing INTERVIEW_END marker)
+                # Falls back to the whole response if the marker was all it contained
+                feedback = response_text.rpartition("INTERVIEW_END")[0].strip() or response_text
                 
                 # Try to extract score from feedback
                 # LM Studio might say "Score: 85" or "85/100" or similar
-                score = None
-                summary = None
-                
-                # Look for score pattern using regex
-                # Matches patterns like "Score: 85", "85/100", "85%", etc.
-                score_match = re.search(r'(\d+)\s*(?:out of 100|/100|%)', feedback, re.IGNORECASE)
-                if score_match:
-                    score = float(score_match.group(1))
-                
-                # If no explicit score found, try to find any number between 0-100
-                # This is a fallback in case LM Studio formats the score differently
-                if score is None:
-                    score_match = re.search(r'\b([0-9]|[1-9][0-9]|100)\b', feedback)
-                    if score_match:
-                        potential_score = float(score_match.group(1))
-                        if 0 <= potential_score <= 100:  # Validate it's in valid range
-                            score = potential_score
-                
-                # If still no score found, generate a default based on conversation length
-                # Longer conversations (more questions answered) get higher scores
-                # This is a fallback to ensure we always have a score
-                if score is None:
-                    score = min(70 + len(self.conversations[interview_id]) * 2, 95)
+                score = _extract_score(feedback, len(conversation))
                 
                 # Add assistant response to history before returning
-                self.conversations[interview_id].append({
+                conversation.append({
                     "role": "assistant",
                     "content": response_text
                 })
@@ -408,7 +732,7 @@ class LMStudioService:
                 }
             
             # Interview continues - add assistant response to history
-            self.conversations[interview_id].append({
+            conversation.append({
                 "role": "assistant",
                 "content": response_text
             })
@@ -419,13 +743,15 @@ class LMStudioService:
                 "content": response_text  # The next question text
             }
             
-        except requests.exceptions.ConnectionError as e:
-            raise Exception(f"Failed to connect to LM Studio: {str(e)}")
-        except requests.exceptions.Timeout as e:
-            raise Exception(f"LM Studio request timed out: {str(e)}")
-        except requests.exceptions.RequestException as e:
-            raise Exception(f"Failed to process answer with LM Studio: {str(e)}")
-        except (KeyError, IndexError) as e:
+        # Network-level failures are raised as ConnectionError/TimeoutError so the
+        # unified service can tell them apart from bugs and fall back to Gemini
+        except httpx.ConnectError as e:
+            raise ConnectionError(f"Failed to connect to LM Studio: {str(e)}")
+        except httpx.TimeoutException as e:
+            raise TimeoutError(f"LM Studio request timed out: {str(e)}")
+        except httpx.HTTPError as e:
+            raise ConnectionError(f"Failed to process answer with LM Studio: {str(e)}")
+        except (KeyError, IndexError, ValueError) as e:
             raise Exception(f"Invalid response format from LM Studio: {str(e)}")
     
     def cleanup(self, interview_id: str):
@@ -439,14 +765,25 @@ class LMStudioService:
             interview_id: The interview to clean up
         """
         # Remove conversation history
-        if interview_id in self.conversations:
-            del self.conversations[interview_id]
+        with self._conversations_lock:
+            self.conversations.pop(interview_id, None)
+            self._last_used.pop(interview_id, None)
+    
+    async def close(self):
+        """
+        Close the HTTP client and its pooled connections.
+        
+        Called on application shutdown.
+        """
+        await self._client.aclose()
 
 
 # Global LM Studio service instance (lazy initialization)
 # We use lazy initialization to avoid errors if LM Studio is not running at import time
 # The service is only created when first needed
 _lm_studio_service: Optional[LMStudioService] = None
+# Guards construction so concurrent first callers don't each build (and probe) a service
+_lm_studio_lock = threading.Lock()
 
 def get_lm_studio_service() -> LMStudioService:
     """
@@ -462,10 +799,16 @@ def get_lm_studio_service() -> LMStudioService:
         LMStudioService: The global service instance
         
     Raises:
-        ConnectionError: If LM Studio is not reachable (raised by LMStudioService.__init__)
+        ValueError: If LM_STUDIO_BASE_URL is invalid (raised by LMStudioService.__init__)
     """
     global _lm_studio_service
-    # Create service only if it doesn't exist yet
-    if _lm_studio_service is None:
-        _lm_studio_service = LMStudioService()
-    return _lm_studio_service
+    # Fast path: no lock once the service exists
+    svc = _lm_studio_service
+    if svc is None:
+        # Double-checked: another caller may have created it while we waited for the lock
+        with _lm_studio_lock:
+            svc = _lm_studio_service
+            if svc is None:
+                svc = LMStudioService()
+                _lm_studio_service = svc
+    return svc
@@ -15,14 +15,19 @@ The server handles WebSocket connections for interview sessions where:
 """
 
 import os
+import asyncio
+import atexit
+import queue
 import logging
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
 from dotenv import load_dotenv
-from .websocket_manager import handle_websocket
+from .websocket_manager import handle_websocket, connection_manager
+from .ai_service import get_ai_service
 from .models import ErrorMessage
 import time
 
@@ -38,6 +43,19 @@ logging.basicConfig(
     level=logging.INFO,  # Log level: INFO shows important events, DEBUG shows everything
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
+
+# Move log output off the request path
+# The root logger only puts records on an in-memory queue; a background
+# listener thread owns the real handlers and does the (possibly slow) writes.
+# This keeps logger.info() calls in the interview hot path cheap even when
+# stderr is piped to a slow consumer
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_root_logger = logging.getLogger()
+_log_listener = QueueListener(_log_queue, *_root_logger.handlers, respect_handler_level=True)
+_root_logger.handlers = [QueueHandler(_log_queue)]
+_log_listener.start()
+atexit.register(_log_listener.stop)  # Flush remaining records on exit
+
 logger = logging.getLogger(__name__)
 
 # Create FastAPI application instance
@@ -86,6 +104,49 @@ else:
     logger.warning(f"Frontend dist directory not found at {FRONTEND_DIST}. Frontend will not be served.")
 
 
+@app.on_event("startup")
+async def warmup_ai_service():
+    """
+    Warm up the AI services when the server starts.
+    
+    Creating the LM Studio and Gemini clients here moves their setup cost
+    off the first interview's critical path.
+    """
+    try:
+        await get_ai_service().warmup()
+    except Exception as e:
+        # Never block startup - services will still initialize lazily on first use
+        logger.warning(f"AI service warm-up failed: {e}")
+
+
+@app.on_event("startup")
+async def start_idle_sweeper():
+    """
+    Start the background task that closes idle WebSocket connections.
+    
+    Dead clients are detected by WebSocket pings; this catches clients that
+    are still connected but abandoned, so their sessions and AI conversations
+    don't linger.
+    """
+    app.state.idle_sweeper = asyncio.create_task(connection_manager.run_idle_sweeper())
+
+
+@app.on_event("shutdown")
+async def stop_idle_sweeper():
+    """
+    Stop the idle connection sweeper when the server stops.
+    """
+    app.state.idle_sweeper.cancel()
+
+
+@app.on_event("shutdown")
+async def close_ai_service():
+    """
+    Close the AI services' HTTP clients when the server stops.
+    """
+    await get_ai_service().close()
+
+
 @app.get("/")
 async def root(request: Request):
     """
@@ -199,4 +260,21 @@ if __name__ == "__main__":
     port = int(os.getenv("PORT", 8000))
     # Start the ASGI server (uvicorn is the ASGI server implementation)
     # host="0.0.0.0" means listen on all network interfaces (accessible from other machines)
-    uvicorn.run(app, host="0.0.0.0", port=port)
+    # "auto" uses uvloop and httptools (from uvicorn[standard]) when they are
+    # installed and falls back to asyncio and h11 otherwise, e.g. on Windows
+    # where uvloop isn't available. Same as start.py's --loop/--http auto
+    # Per-message deflate is off: most frames are ~100-byte state updates,
+    # which cost CPU to compress and gain nothing from it
+    # Pings every 10s with a 10s timeout detect a dead client within ~20s
+    # (the defaults of 20s/20s allow up to 40s)
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=port,
+        loop="auto",
+        http="auto",
+        ws="websockets",
+        ws_per_message_deflate=False,
+        ws_ping_interval=10.0,
+        ws_ping_timeout=10.0
+    )
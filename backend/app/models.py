@@ -16,8 +16,9 @@ All messages follow a consistent structure with:
 """
 
 from enum import Enum
-from typing import Optional, List
+from typing import Annotated, Optional, List
 from pydantic import BaseModel, Field
+import msgspec
 
 
 class InterviewState(str, Enum):
@@ -64,6 +65,7 @@ class MessageType(str, Enum):
     Types:
         USER_TRANSCRIPT: User's speech converted to text
         AI_QUESTION: AI interviewer's question
+        AI_QUESTION_CHUNK: Partial AI response text, streamed before AI_QUESTION
         INTERVIEW_STATE: State change notification
         INTERVIEW_END: Interview completion with feedback
         ERROR: Error occurred, contains error details
@@ -71,6 +73,7 @@ class MessageType(str, Enum):
     """
     USER_TRANSCRIPT = "USER_TRANSCRIPT"
     AI_QUESTION = "AI_QUESTION"
+    AI_QUESTION_CHUNK = "AI_QUESTION_CHUNK"
     INTERVIEW_STATE = "INTERVIEW_STATE"
     INTERVIEW_END = "INTERVIEW_END"
     ERROR = "ERROR"
@@ -123,6 +126,31 @@ class AIQuestionMessage(BaseModel):
     timestamp: float
 
 
+class AIQuestionChunkMessage(BaseModel):
+    """
+    Message sent from server with a partial piece of the AI's response.
+    
+    When the AI service streams its reply, each chunk is forwarded as soon as
+    it arrives so the frontend can show text before the full reply is ready.
+    The complete text always follows in an AI_QUESTION (or INTERVIEW_END)
+    message, which remains the authoritative version.
+    
+    Fields:
+        type: Always AI_QUESTION_CHUNK
+        interview_id: Which interview session this belongs to
+        delta: The new text since the previous chunk
+        timestamp: When the chunk was received
+        reset: Discard the text received so far (delta is empty); sent when
+               the reply turns out to be final feedback or is regenerated
+               by the fallback service
+    """
+    type: MessageType = MessageType.AI_QUESTION_CHUNK
+    interview_id: str
+    delta: str  # Newly generated text
+    timestamp: float
+    reset: bool = False  # Discard the text received so far
+
+
 class InterviewStateMessage(BaseModel):
     """
     Message sent from server to update client about interview state.
@@ -219,3 +247,44 @@ class ConnectionAckMessage(BaseModel):
     interview_id: str
     message: str = "Connected successfully"  # Default confirmation message
     timestamp: float
+
+
+class UserTranscriptStruct(msgspec.Struct, tag_field="type", tag="USER_TRANSCRIPT"):
+    """
+    msgspec version of UserTranscriptMessage, used to validate inbound transcripts.
+    
+    Applies the same rules as the Pydantic model: the transcript must not be
+    empty and the "type" field must be USER_TRANSCRIPT.
+    """
+    interview_id: str
+    transcript: Annotated[str, msgspec.Meta(min_length=1)]  # Must not be empty
+    timestamp: float
+
+
+# Fast-path structs for the most frequent outbound messages
+# State updates, questions and streamed chunks are sent many times per
+# interview and carry trusted server data, so they skip Pydantic entirely
+# and are encoded with msgspec. Each serializes to exactly the same JSON as
+# its Pydantic counterpart above (the tag becomes the "type" field), which
+# remains the documented schema.
+
+class InterviewStateStruct(msgspec.Struct, tag_field="type", tag="INTERVIEW_STATE"):
+    """msgspec version of InterviewStateMessage."""
+    interview_id: str
+    state: InterviewState
+    timestamp: float
+
+
+class AIQuestionStruct(msgspec.Struct, tag_field="type", tag="AI_QUESTION"):
+    """msgspec version of AIQuestionMessage."""
+    interview_id: str
+    question: str
+    timestamp: float
+
+
+class AIQuestionChunkStruct(msgspec.Struct, tag_field="type", tag="AI_QUESTION_CHUNK"):
+    """msgspec version of AIQuestionChunkMessage."""
+    interview_id: str
+    delta: str
+    timestamp: float
+    reset: bool = False
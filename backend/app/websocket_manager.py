@@ -1,16 +1,22 @@
 """
 WebSocket connection manager for interview sessions.
 """
-import json
+import os
 import logging
 import asyncio
-from typing import Dict, Optional
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+import orjson
+import msgspec
 from fastapi import WebSocket, WebSocketDisconnect
+from fastapi.websockets import WebSocketState
+from pydantic import BaseModel
 from .models import (
     MessageType,
-    UserTranscriptMessage,
-    AIQuestionMessage,
-    InterviewStateMessage,
+    UserTranscriptStruct,
+    AIQuestionStruct,
+    AIQuestionChunkStruct,
+    InterviewStateStruct,
     InterviewEndMessage,
     ErrorMessage,
     ConnectionAckMessage,
@@ -22,52 +28,274 @@ import time
 
 logger = logging.getLogger(__name__)
 
+# Reusable encoder for the msgspec message structs
+_ENCODER = msgspec.json.Encoder()
+
+# Pre-encoded pieces of an INTERVIEW_STATE message, in InterviewStateStruct's
+# key order (tag first, then fields as declared). State updates differ only in
+# interview_id and timestamp, which are filled in at send time instead of
+# encoding the whole message every turn
+_STATE_PREFIX = '{"type":"INTERVIEW_STATE","interview_id":'
+_STATE_TEMPLATES: Dict[InterviewState, str] = {
+    state: ',"state":"%s","timestamp":' % state.value for state in InterviewState
+}
+
+# Lowercased substrings used to classify initialization errors for the client
+_API_KEY_KEYWORDS = ("api_key", "api key", "authentication")
+_UNAVAILABLE_KEYWORDS = ("not available", "not reachable")
+
+# Outbound messages queued per connection before senders have to wait
+OUTBOX_SIZE = 64
+# How long closing a connection waits for its queued messages to be sent
+WRITER_DRAIN_TIMEOUT = 5.0
+# Connections with no message in either direction for this long are closed by
+# the sweeper. Outbound messages count, so a long AI turn (which streams chunks)
+# isn't mistaken for an idle client. Generous by default: candidates can think
+# for a while before answering
+IDLE_TIMEOUT = float(os.getenv("WS_IDLE_TIMEOUT", "600"))
+# How often the sweeper checks for idle connections
+IDLE_SWEEP_INTERVAL = 30.0
+
+
+@dataclass
+class ConnectionSlot:
+    """
+    Everything the manager keeps for one open connection.
+    
+    Kept together so each operation needs a single lookup by interview_id.
+    """
+    __slots__ = ("websocket", "queue", "writer", "last_seen", "closing")
+    
+    websocket: WebSocket
+    # Outbound queue of serialized messages (None tells the writer to stop)
+    queue: asyncio.Queue
+    # Task draining the queue onto the socket (set right after the slot is built)
+    writer: Optional[asyncio.Task]
+    # time.time() of the last message received from or queued for the client
+    last_seen: float
+    # Set when the connection was removed while its queue was full: the
+    # writer stops once the queue is empty instead of at a None sentinel
+    closing: bool
+
 
 class ConnectionManager:
-    """Manages WebSocket connections for interview sessions."""
+    """
+    Manages WebSocket connections for interview sessions.
+    
+    Each connection has an outbound queue drained by its own writer task, so
+    senders only enqueue frames and never wait on the socket themselves
+    (unless the queue is full, which applies backpressure to a slow client).
+    """
     
     def __init__(self):
-        self.active_connections: Dict[str, WebSocket] = {}
+        self.connections: Dict[str, ConnectionSlot] = {}
     
     async def connect(self, websocket: WebSocket, interview_id: str):
         """Accept a WebSocket connection."""
+        # No TCP_NODELAY setup is needed for the small state frames: asyncio's
+        # and uvloop's TCP transports already disable Nagle on every accepted
+        # socket, and the ASGI interface doesn't expose the socket anyway
         await websocket.accept()
-        self.active_connections[interview_id] = websocket
+        # A reconnect with the same interview_id replaces the old connection
+        self.disconnect(interview_id)
+        slot = ConnectionSlot(websocket, asyncio.Queue(maxsize=OUTBOX_SIZE), None, time.time(), False)
+        slot.writer = asyncio.create_task(self._writer(interview_id, slot))
+        self.connections[interview_id] = slot
         logger.info(f"WebSocket connected for interview: {interview_id}")
     
     def disconnect(self, interview_id: str):
-        """Remove a WebSocket connection."""
-        if interview_id in self.active_connections:
-            del self.active_connections[interview_id]
+        """
+        Remove a WebSocket connection.
+        
+        Its writer stops once the messages already queued have been sent.
+        The connection is no longer looked up, so nothing new is queued.
+        """
+        slot = self.connections.pop(interview_id, None)
+        if slot is not None:
             logger.info(f"WebSocket disconnected for interview: {interview_id}")
+            try:
+                slot.queue.put_nowait(None)  # Sentinel: the writer exits when it reaches it
+            except asyncio.QueueFull:
+                # No room for the sentinel. The writer keeps draining (which
+                # also lets senders waiting for space finish) and stops once
+                # the queue is empty
+                slot.closing = True
+    
+    async def close(self, interview_id: str):
+        """
+        Remove a WebSocket connection and wait for its queued messages to be sent.
+        
+        Called when the handler finishes, before the socket is closed, so
+        final messages (e.g. INTERVIEW_END) aren't lost. Gives up after
+        WRITER_DRAIN_TIMEOUT seconds and discards whatever is still queued.
+        """
+        slot = self.connections.get(interview_id)
+        self.disconnect(interview_id)
+        if slot is not None:
+            done, _ = await asyncio.wait({slot.writer}, timeout=WRITER_DRAIN_TIMEOUT)
+            if not done:
+                slot.writer.cancel()
+                # Each get wakes one sender blocked on the full queue; yielding
+                # lets it finish its put, which is discarded in turn. Stops once
+                # no sender is left waiting on a queue nobody reads any more
+                while not slot.queue.empty():
+                    slot.queue.get_nowait()
+                    await asyncio.sleep(0)
     
-    async def send_message(self, interview_id: str, message: dict):
-        """Send a message to a specific interview session."""
-        if interview_id in self.active_connections:
+    def touch(self, interview_id: str):
+        """Record that a message was just received from or sent to the client."""
+        slot = self.connections.get(interview_id)
+        if slot is not None:
+            slot.last_seen = time.time()
+    
+    async def sweep_idle(self):
+        """
+        Close connections that have been idle for longer than IDLE_TIMEOUT.
+        
+        Closing the socket makes the handler's receive fail, so the handler
+        runs its normal cleanup (session, AI conversation, writer).
+        """
+        cutoff = time.time() - IDLE_TIMEOUT
+        # Copy first: closing lets handlers remove their slots while we iterate
+        stale = [
+            (interview_id, slot) for interview_id, slot in list(self.connections.items())
+            if slot.last_seen < cutoff
+        ]
+        for interview_id, slot in stale:
+            logger.info(f"Closing idle WebSocket for interview: {interview_id}")
+            try:
+                await slot.websocket.close(code=1001)  # Going away
+            except Exception as e:
+                logger.debug(f"Error closing idle WebSocket for {interview_id}: {e}")
+    
+    async def run_idle_sweeper(self):
+        """
+        Sweep idle connections every IDLE_SWEEP_INTERVAL seconds until cancelled.
+        """
+        while True:
+            await asyncio.sleep(IDLE_SWEEP_INTERVAL)
             try:
-                websocket = self.active_connections[interview_id]
-                # Check if connection is still open before sending
-                if websocket.client_state.name != "CONNECTED":
-                    logger.warning(f"WebSocket for {interview_id} is not connected (state: {websocket.client_state.name})")
-                    self.disconnect(interview_id)
+                await self.sweep_idle()
+            except Exception as e:
+                # Keep sweeping - one bad pass shouldn't stop the reaper
+                logger.error(f"Idle connection sweep failed: {e}")
+    
+    async def send_model(self, interview_id: str, message: BaseModel):
+        """
+        Send a Pydantic message model to a specific interview session.
+        
+        The model's pydantic-core serializer is called directly, without
+        building an intermediate dict first.
+        """
+        await self._send_text(interview_id, message.__pydantic_serializer__.to_json(message).decode())
+    
+    async def send_struct(self, interview_id: str, message: msgspec.Struct):
+        """
+        Send a msgspec message struct to a specific interview session.
+        """
+        await self._send_text(interview_id, _ENCODER.encode(message).decode())
+    
+    async def send_state(self, interview_id: str, state: InterviewState, timestamp: float):
+        """
+        Send an INTERVIEW_STATE message built from its pre-encoded template.
+        
+        Produces the same JSON as encoding InterviewStateStruct, with the
+        keys in the same order.
+        """
+        id_json = orjson.dumps(interview_id).decode()  # JSON-escaped, with quotes
+        await self._send_text(
+            interview_id,
+            f'{_STATE_PREFIX}{id_json}{_STATE_TEMPLATES[state]}{timestamp!r}}}'
+        )
+    
+    async def send_batch(self, interview_id: str, messages: List[msgspec.Struct]):
+        """
+        Send several msgspec message structs in a single frame.
+        
+        The messages are encoded once as a JSON array, which the client
+        unpacks and handles in order. Saves a frame (and a send) per message
+        when several are emitted back to back.
+        """
+        await self._send_text(interview_id, _ENCODER.encode(messages).decode())
+    
+    async def _send_text(self, interview_id: str, text: str):
+        """
+        Queue serialized JSON for a specific interview session.
+        
+        The connection's writer task sends it; messages for unknown or
+        closed connections are dropped. Queuing counts as activity for the
+        idle sweeper.
+        """
+        slot = self.connections.get(interview_id)
+        if slot is not None:
+            slot.last_seen = time.time()
+            await slot.queue.put(text)
+    
+    async def _writer(self, interview_id: str, slot: ConnectionSlot):
+        """
+        Send a connection's queued messages in order until told to stop.
+        
+        Frames are sent as text because the client JSON.parses event.data,
+        which would be a Blob for binary frames. After a failed send the
+        remaining messages are discarded rather than left in the queue, so
+        senders waiting for space don't wait forever.
+        
+        Args:
+            interview_id: The interview the connection belongs to
+            slot: The connection's slot (socket, outbound queue, closing flag)
+        """
+        websocket, queue = slot.websocket, slot.queue
+        failed = False
+        while True:
+            if slot.closing and queue.empty():
+                # A sender woken by the last get may still be about to put
+                await asyncio.sleep(0)
+                if queue.empty():
                     return
-                await websocket.send_json(message)
+            text = await queue.get()
+            if text is None:
+                return
+            if failed:
+                continue
+            try:
+                # No open-state probe first: sending on a closed socket raises,
+                # and the except below handles it
+                await websocket.send_text(text)
             except Exception as e:
                 # Don't log as error if connection is already closed - this is expected
                 if "no close frame" not in str(e).lower() and "connection closed" not in str(e).lower():
                     logger.error(f"Error sending message to {interview_id}: {e}")
-                self.disconnect(interview_id)
-                # Don't raise - just log and disconnect gracefully
+                # Don't raise - just log, disconnect gracefully and discard
+                # the rest until the disconnect's stop signal arrives
+                failed = True
+                self._drop(interview_id, websocket)
     
-    async def send_error(self, interview_id: str, error: str, code: Optional[str] = None):
-        """Send an error message."""
+    def _drop(self, interview_id: str, websocket: WebSocket):
+        """Disconnect after a failed send, unless the interview has already reconnected."""
+        slot = self.connections.get(interview_id)
+        if slot is not None and slot.websocket is websocket:
+            self.disconnect(interview_id)
+    
+    async def send_error(
+        self,
+        interview_id: str,
+        error: str,
+        code: Optional[str] = None,
+        timestamp: Optional[float] = None
+    ):
+        """
+        Send an error message.
+        
+        Callers that already took a timestamp for the current step pass it
+        as timestamp; otherwise the current time is used.
+        """
         error_msg = ErrorMessage(
             interview_id=interview_id,
             error=error,
             code=code,
-            timestamp=time.time()
+            timestamp=timestamp if timestamp is not None else time.time()
         )
-        await self.send_message(interview_id, error_msg.model_dump())
+        await self.send_model(interview_id, error_msg)
 
 
 # Global connection manager
@@ -78,6 +306,11 @@ async def handle_websocket(websocket: WebSocket, interview_id: str):
     """
     Handle WebSocket connection for an interview session.
     
+    The frequent server-generated messages (state updates, questions and
+    streamed chunks) are msgspec structs, which skip validation: their fields
+    come from trusted server code. Messages carrying data that is worth
+    checking (end feedback and score, errors) are validated Pydantic models.
+    
     Flow:
     1. Accept connection and send ACK
     2. Initialize interview session
@@ -87,22 +320,21 @@ async def handle_websocket(websocket: WebSocket, interview_id: str):
     6. Process with AI service
     7. Send next question or end signal
     """
+    # Resolved once per connection and reused for every turn and the cleanup
+    ai_service = get_ai_service()
     await connection_manager.connect(websocket, interview_id)
     
     try:
-        # Send connection acknowledgment immediately and directly
-        # This ensures the client knows the connection is established
+        # Queue the connection acknowledgment first
+        # This ensures the client knows the connection is established. The
+        # writer sends it while the AI greeting is being generated, and the
+        # queue keeps it ahead of every later message. If the send fails, the
+        # writer drops the connection and the receive loop exits on disconnect
         ack = ConnectionAckMessage(
             interview_id=interview_id,
             timestamp=time.time()
         )
-        try:
-            await websocket.send_json(ack.model_dump())
-            logger.info(f"Connection ACK sent for interview {interview_id}")
-        except Exception as e:
-            logger.warning(f"Failed to send ACK to {interview_id}: {e}")
-            # If we can't send ACK, the connection is likely broken
-            return
+        await connection_manager.send_model(interview_id, ack)
         
         # Create or get interview session
         session = state_manager.get_session(interview_id)
@@ -110,115 +342,126 @@ async def handle_websocket(websocket: WebSocket, interview_id: str):
             session = state_manager.create_session(interview_id)
             # Initialize AI conversation (tries LM Studio first, falls back to Gemini)
             try:
-                ai_service = get_ai_service()
-                greeting = ai_service.initialize_conversation(interview_id)
+                greeting = await ai_service.initialize_conversation(interview_id)
+                now = time.time()  # One timestamp for all messages of this step
                 
                 # Transition to AI_SPEAKING state
                 session.transition_to(InterviewState.AI_SPEAKING)
-                
-                # Send state update
-                state_msg = InterviewStateMessage(
+                speaking_msg = InterviewStateStruct(
                     interview_id=interview_id,
                     state=InterviewState.AI_SPEAKING,
-                    timestamp=time.time()
+                    timestamp=now
                 )
-                await connection_manager.send_message(interview_id, state_msg.model_dump())
                 
-                # Send greeting question
-                question_msg = AIQuestionMessage(
+                # Greeting question
+                question_msg = AIQuestionStruct(
                     interview_id=interview_id,
                     question=greeting,
-                    timestamp=time.time()
+                    timestamp=now
                 )
-                await connection_manager.send_message(interview_id, question_msg.model_dump())
                 
                 # Transition to WAITING_FOR_USER
                 session.transition_to(InterviewState.WAITING_FOR_USER)
-                state_msg = InterviewStateMessage(
+                waiting_msg = InterviewStateStruct(
                     interview_id=interview_id,
                     state=InterviewState.WAITING_FOR_USER,
-                    timestamp=time.time()
+                    timestamp=now
                 )
-                await connection_manager.send_message(interview_id, state_msg.model_dump())
+                
+                # Send state updates and greeting in one frame
+                await connection_manager.send_batch(interview_id, [speaking_msg, question_msg, waiting_msg])
                 
             except Exception as e:
                 logger.error(f"Error initializing interview {interview_id}: {e}", exc_info=True)
+                now = time.time()
                 error_msg = str(e)
                 # Check if it's an API key issue or service unavailable
-                if "API_KEY" in error_msg or "api key" in error_msg.lower() or "authentication" in error_msg.lower():
+                error_lower = error_msg.lower()
+                if any(keyword in error_lower for keyword in _API_KEY_KEYWORDS):
                     error_msg = "Invalid or missing API key. Please check your backend .env file."
-                elif "not available" in error_msg.lower() or "not reachable" in error_msg.lower():
+                elif any(keyword in error_lower for keyword in _UNAVAILABLE_KEYWORDS):
                     error_msg = "AI service is not available. Please ensure LM Studio is running or Gemini API key is configured."
                 
                 # Send error message first
                 await connection_manager.send_error(
                     interview_id,
                     error_msg,
-                    "INIT_ERROR"
+                    "INIT_ERROR",
+                    timestamp=now
                 )
                 # Set session to ended state
                 session.transition_to(InterviewState.INTERVIEW_ENDED)
                 
                 # Send state update
-                state_msg = InterviewStateMessage(
-                    interview_id=interview_id,
-                    state=InterviewState.INTERVIEW_ENDED,
-                    timestamp=time.time()
-                )
-                await connection_manager.send_message(interview_id, state_msg.model_dump())
+                await connection_manager.send_state(interview_id, InterviewState.INTERVIEW_ENDED, now)
                 
                 end_msg = InterviewEndMessage(
                     interview_id=interview_id,
                     feedback=f"Interview could not be started: {error_msg}",
                     score=None,
                     summary=None,
-                    timestamp=time.time()
+                    timestamp=now
                 )
-                await connection_manager.send_message(interview_id, end_msg.model_dump())
-                
-                # Wait longer to ensure messages are sent before closing
-                await asyncio.sleep(1.0)
+                await connection_manager.send_model(interview_id, end_msg)
                 
-                # Keep connection open briefly to allow frontend to receive messages
-                # The connection will close naturally when the function returns
+                # Flush the queued error and end messages, then close right away
+                # with 1011 (internal error) instead of sleeping and hoping
+                # they were sent. The cleanup in finally is a no-op for the
+                # already-closed connection
+                await connection_manager.close(interview_id)
+                try:
+                    await websocket.close(code=1011)
+                except Exception as close_error:
+                    # The client may have gone away already
+                    logger.debug(f"Error closing WebSocket for {interview_id}: {close_error}")
                 return
         
         # Main message loop - only enters if initialization was successful
         while True:
             try:
                 # Receive message from client
-                data = await websocket.receive_json()
+                # Parsed with orjson, then validated by msgspec in C
+                data = orjson.loads(await websocket.receive_text())
+                connection_manager.touch(interview_id)
                 message_type = data.get("type")
                 
                 if message_type == MessageType.USER_TRANSCRIPT:
                     # Handle user transcript
-                    transcript_msg = UserTranscriptMessage(**data)
-                    session = state_manager.get_session(interview_id)
+                    transcript_msg = msgspec.convert(data, UserTranscriptStruct)
                     
-                    if not session:
-                        await connection_manager.send_error(
-                            interview_id,
-                            "Interview session not found",
-                            "SESSION_NOT_FOUND"
+                    # Update state (session was fetched or created above and
+                    # is only removed when this loop ends)
+                    session.transition_to(InterviewState.PROCESSING_WITH_GEMINI)
+                    await connection_manager.send_state(interview_id, InterviewState.PROCESSING_WITH_GEMINI, time.time())
+                    
+                    # Forward partial response text to the client as it streams in
+                    async def send_chunk(delta: str):
+                        chunk_msg = AIQuestionChunkStruct(
+                            interview_id=interview_id,
+                            delta=delta,
+                            timestamp=time.time()
                         )
-                        continue
+                        await connection_manager.send_struct(interview_id, chunk_msg)
                     
-                    # Update state
-                    session.transition_to(InterviewState.PROCESSING_WITH_GEMINI)
-                    state_msg = InterviewStateMessage(
-                        interview_id=interview_id,
-                        state=InterviewState.PROCESSING_WITH_GEMINI,
-                        timestamp=time.time()
-                    )
-                    await connection_manager.send_message(interview_id, state_msg.model_dump())
+                    # Tell the client to discard the partial text shown so far
+                    async def send_reset():
+                        reset_msg = AIQuestionChunkStruct(
+                            interview_id=interview_id,
+                            delta="",
+                            timestamp=time.time(),
+                            reset=True
+                        )
+                        await connection_manager.send_struct(interview_id, reset_msg)
                     
                     # Process with AI service (LM Studio or Gemini)
                     try:
-                        ai_service = get_ai_service()
-                        result = ai_service.process_answer(
+                        result = await ai_service.process_answer(
                             interview_id,
-                            transcript_msg.transcript
+                            transcript_msg.transcript,
+                            on_chunk=send_chunk,
+                            on_reset=send_reset
                         )
+                        now = time.time()  # One timestamp for all messages of this step
                         
                         if result["type"] == "end":
                             # Interview ended
@@ -229,57 +472,53 @@ async def handle_websocket(websocket: WebSocket, interview_id: str):
                                 feedback=result["content"],
                                 score=result.get("score"),
                                 summary=result.get("summary"),
-                                timestamp=time.time()
+                                timestamp=now
                             )
-                            await connection_manager.send_message(interview_id, end_msg.model_dump())
+                            await connection_manager.send_model(interview_id, end_msg)
                             
                             # Cleanup
                             state_manager.remove_session(interview_id)
-                            ai_service.cleanup(interview_id)
+                            await ai_service.cleanup(interview_id)
                             break
                         else:
                             # Next question
                             session.increment_question_count()
                             session.transition_to(InterviewState.AI_SPEAKING)
-                            
-                            state_msg = InterviewStateMessage(
+                            speaking_msg = InterviewStateStruct(
                                 interview_id=interview_id,
                                 state=InterviewState.AI_SPEAKING,
-                                timestamp=time.time()
+                                timestamp=now
                             )
-                            await connection_manager.send_message(interview_id, state_msg.model_dump())
                             
-                            question_msg = AIQuestionMessage(
+                            question_msg = AIQuestionStruct(
                                 interview_id=interview_id,
                                 question=result["content"],
-                                timestamp=time.time()
+                                timestamp=now
                             )
-                            await connection_manager.send_message(interview_id, question_msg.model_dump())
                             
                             # Transition to WAITING_FOR_USER
                             session.transition_to(InterviewState.WAITING_FOR_USER)
-                            state_msg = InterviewStateMessage(
+                            waiting_msg = InterviewStateStruct(
                                 interview_id=interview_id,
                                 state=InterviewState.WAITING_FOR_USER,
-                                timestamp=time.time()
+                                timestamp=now
                             )
-                            await connection_manager.send_message(interview_id, state_msg.model_dump())
+                            
+                            # Send state updates and question in one frame
+                            await connection_manager.send_batch(interview_id, [speaking_msg, question_msg, waiting_msg])
                             
                     except Exception as e:
                         logger.error(f"Error processing answer for {interview_id}: {e}")
+                        now = time.time()
                         await connection_manager.send_error(
                             interview_id,
                             f"Failed to process answer: {str(e)}",
-                            "PROCESSING_ERROR"
+                            "PROCESSING_ERROR",
+                            timestamp=now
                         )
                         # Reset to waiting state
                         session.transition_to(InterviewState.WAITING_FOR_USER)
-                        state_msg = InterviewStateMessage(
-                            interview_id=interview_id,
-                            state=InterviewState.WAITING_FOR_USER,
-                            timestamp=time.time()
-                        )
-                        await connection_manager.send_message(interview_id, state_msg.model_dump())
+                        await connection_manager.send_state(interview_id, InterviewState.WAITING_FOR_USER, now)
                 
                 else:
                     await connection_manager.send_error(
@@ -292,6 +531,13 @@ async def handle_websocket(websocket: WebSocket, interview_id: str):
                 logger.info(f"WebSocket disconnected for interview: {interview_id}")
                 break
             except Exception as e:
+                # A socket closed from our side (e.g. by the idle sweeper) makes
+                # receive raise RuntimeError instead of WebSocketDisconnect, and
+                # would keep raising on every retry
+                if (websocket.application_state != WebSocketState.CONNECTED
+                        or websocket.client_state != WebSocketState.CONNECTED):
+                    logger.info(f"WebSocket closed for interview: {interview_id}")
+                    break
                 logger.error(f"Error handling message for {interview_id}: {e}")
                 await connection_manager.send_error(
                     interview_id,
@@ -305,10 +551,12 @@ async def handle_websocket(websocket: WebSocket, interview_id: str):
         logger.error(f"WebSocket error for {interview_id}: {e}")
     finally:
         # Cleanup
-        connection_manager.disconnect(interview_id)
+        # Removing the session is a plain dict operation. Flushing the
+        # connection's queued messages and the AI service cleanup can both wait
+        # on I/O, so they run concurrently
         state_manager.remove_session(interview_id)
-        try:
-            ai_service = get_ai_service()
-            ai_service.cleanup(interview_id)
-        except:
-            pass  # Ignore cleanup errors
+        await asyncio.gather(
+            connection_manager.close(interview_id),
+            ai_service.cleanup(interview_id),
+            return_exceptions=True  # Ignore cleanup errors
+        )
@@ -29,6 +29,7 @@ export const InterviewRoom: React.FC<InterviewRoomProps> = ({
     feedback,
     score,
     error,
+    streamingText,
     setState,
     startInterview,
     endInterview,
@@ -238,7 +239,7 @@ export const InterviewRoom: React.FC<InterviewRoomProps> = ({
 
         {/* Transcript Panel */}
         <div className="w-80 border-l border-meet-gray">
-          <TranscriptPanel transcript={transcript} />
+          <TranscriptPanel transcript={transcript} streamingText={streamingText} />
         </div>
       </div>
 
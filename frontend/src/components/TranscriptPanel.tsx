@@ -7,19 +7,21 @@ import { TranscriptEntry } from '../types/interview';
 
 interface TranscriptPanelProps {
   transcript: TranscriptEntry[];
+  streamingText?: string;
 }
 
 export const TranscriptPanel: React.FC<TranscriptPanelProps> = ({
   transcript,
+  streamingText,
 }) => {
   const scrollRef = useRef<HTMLDivElement>(null);
 
-  // Auto-scroll to bottom when new entries are added
+  // Auto-scroll to bottom when new entries are added or streamed text grows
   useEffect(() => {
     if (scrollRef.current) {
       scrollRef.current.scrollTop = scrollRef.current.scrollHeight;
     }
-  }, [transcript]);
+  }, [transcript, streamingText]);
 
   const formatTime = (timestamp: number): string => {
     const date = new Date(timestamp);
@@ -38,7 +40,7 @@ export const TranscriptPanel: React.FC<TranscriptPanelProps> = ({
         ref={scrollRef}
         className="flex-1 overflow-y-auto px-4 py-4 space-y-4"
       >
-        {transcript.length === 0 ? (
+        {transcript.length === 0 && !streamingText ? (
           <div className="text-gray-400 text-sm text-center py-8">
             Transcript will appear here...
           </div>
@@ -71,6 +73,16 @@ export const TranscriptPanel: React.FC<TranscriptPanelProps> = ({
             </div>
           ))
         )}
+
+        {/* AI reply still being generated */}
+        {streamingText && (
+          <div className="flex flex-col space-y-1 items-start">
+            <div className="max-w-[80%] rounded-lg px-4 py-2 bg-meet-gray text-white opacity-80">
+              <div className="text-sm font-medium mb-1">AI Interviewer</div>
+              <div className="text-sm whitespace-pre-wrap">{streamingText}</div>
+            </div>
+          </div>
+        )}
       </div>
     </div>
   );
@@ -64,42 +64,61 @@ export function useWebSocket({
 
       ws.onmessage = (event) => {
         try {
-          const message: WebSocketMessage = JSON.parse(event.data);
-          
-          // Handle different message types
-          switch (message.type) {
-            case MessageType.CONNECTION_ACK:
-              console.log('Connection acknowledged:', message);
-              break;
-
-            case MessageType.INTERVIEW_STATE:
-              setState(message.state);
-              break;
-
-            case MessageType.AI_QUESTION:
-              setState(InterviewState.AI_SPEAKING);
-              useInterviewStore.getState().addTranscriptEntry({
-                id: `ai-${Date.now()}`,
-                role: 'ai',
-                text: message.question,
-                timestamp: message.timestamp,
-              });
-              break;
-
-            case MessageType.INTERVIEW_END:
-              endInterview(message.feedback, message.score);
-              break;
-
-            case MessageType.ERROR:
-              setError(message.error);
-              console.error('WebSocket error:', message);
-              // Don't break - let the error propagate to the component
-              break;
-          }
-
-          // Call custom onMessage handler
-          if (onMessage) {
-            onMessage(message);
+          // The server may batch consecutive messages into one frame as a JSON array
+          const parsed: WebSocketMessage | WebSocketMessage[] = JSON.parse(event.data);
+          const messages = Array.isArray(parsed) ? parsed : [parsed];
+
+          for (const message of messages) {
+            // Handle different message types
+            switch (message.type) {
+              case MessageType.CONNECTION_ACK:
+                console.log('Connection acknowledged:', message);
+                break;
+
+              case MessageType.INTERVIEW_STATE:
+                setState(message.state);
+                break;
+
+              case MessageType.AI_QUESTION:
+                setState(InterviewState.AI_SPEAKING);
+                // The complete question replaces the streamed partial text
+                useInterviewStore.getState().clearStreamingText();
+                useInterviewStore.getState().addTranscriptEntry({
+                  id: `ai-${Date.now()}`,
+                  role: 'ai',
+                  text: message.question,
+                  timestamp: message.timestamp,
+                });
+                break;
+
+              case MessageType.AI_QUESTION_CHUNK:
+                // Partial text while the AI is still generating, shown as it
+                // arrives; the full question follows in AI_QUESTION, which
+                // drives TTS and the transcript. reset discards the partial
+                // text (the reply became final feedback or is being regenerated)
+                if (message.reset) {
+                  useInterviewStore.getState().clearStreamingText();
+                } else {
+                  useInterviewStore.getState().appendStreamingText(message.delta);
+                }
+                break;
+
+              case MessageType.INTERVIEW_END:
+                endInterview(message.feedback, message.score);
+                break;
+
+              case MessageType.ERROR:
+                useInterviewStore.getState().clearStreamingText();
+                setError(message.error);
+                console.error('WebSocket error:', message);
+                // Don't break - let the error propagate to the component
+                break;
+            }
+
+            // Call custom onMessage handler
+            if (onMessage) {
+              onMessage(message);
+            }
           }
         } catch (error) {
           console.error('Error parsing WebSocket message:', error);
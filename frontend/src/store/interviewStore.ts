@@ -8,6 +8,8 @@ interface InterviewStore extends InterviewSession {
   // Actions
   setState: (state: InterviewState) => void;
   addTranscriptEntry: (entry: TranscriptEntry) => void;
+  appendStreamingText: (delta: string) => void;
+  clearStreamingText: () => void;
   startInterview: (interviewId: string) => void;
   endInterview: (feedback?: string, score?: number) => void;
   setError: (error: string | undefined) => void;
@@ -32,6 +34,13 @@ export const useInterviewStore = create<InterviewStore>((set) => ({
       transcript: [...state.transcript, entry],
     })),
 
+  appendStreamingText: (delta) =>
+    set((state) => ({
+      streamingText: (state.streamingText ?? '') + delta,
+    })),
+
+  clearStreamingText: () => set({ streamingText: undefined }),
+
   startInterview: (interviewId) =>
     set({
       interviewId,
@@ -41,6 +50,7 @@ export const useInterviewStore = create<InterviewStore>((set) => ({
       error: undefined,
       feedback: undefined,
       score: undefined,
+      streamingText: undefined,
     }),
 
   endInterview: (feedback, score) =>
@@ -49,6 +59,7 @@ export const useInterviewStore = create<InterviewStore>((set) => ({
       isActive: false,
       feedback,
       score,
+      streamingText: undefined,
     }),
 
   setError: (error) => set({ error }),
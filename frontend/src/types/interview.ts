@@ -16,6 +16,7 @@ export enum InterviewState {
 export enum MessageType {
   USER_TRANSCRIPT = "USER_TRANSCRIPT",
   AI_QUESTION = "AI_QUESTION",
+  AI_QUESTION_CHUNK = "AI_QUESTION_CHUNK",
   INTERVIEW_STATE = "INTERVIEW_STATE",
   INTERVIEW_END = "INTERVIEW_END",
   ERROR = "ERROR",
@@ -36,6 +37,14 @@ export interface AIQuestionMessage {
   timestamp: number;
 }
 
+export interface AIQuestionChunkMessage {
+  type: MessageType.AI_QUESTION_CHUNK;
+  interview_id: string;
+  delta: string;
+  timestamp: number;
+  reset?: boolean;
+}
+
 export interface InterviewStateMessage {
   type: MessageType.INTERVIEW_STATE;
   interview_id: string;
@@ -70,6 +79,7 @@ export interface ConnectionAckMessage {
 export type WebSocketMessage =
   | UserTranscriptMessage
   | AIQuestionMessage
+  | AIQuestionChunkMessage
   | InterviewStateMessage
   | InterviewEndMessage
   | ErrorMessage
@@ -90,4 +100,5 @@ export interface InterviewSession {
   error?: string;
   feedback?: string;
   score?: number;
+  streamingText?: string;
 }
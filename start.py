@@ -16,47 +16,71 @@ Usage:
     python start.py --build-only      # Only build frontend, don't start servers
 """
 
+# Only os and sys are imported up front; everything else is imported where it's
+# used, so quick invocations (e.g. --help) don't pay for modules they never need
 import os
 import sys
-import subprocess
-import signal
-import time
-import argparse
-from pathlib import Path
 
 # Get the project root directory (where this script is located)
-PROJECT_ROOT = Path(__file__).parent.absolute()
-BACKEND_DIR = PROJECT_ROOT / "backend"
-FRONTEND_DIR = PROJECT_ROOT / "frontend"
+PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(PROJECT_ROOT, "backend")
+FRONTEND_DIR = os.path.join(PROJECT_ROOT, "frontend")
+
+# Absolute path of npm, resolved once in main() (None if it isn't installed)
+NPM = None
+
+# Running servers as (name, process, color), for the signal handler
+_PROCS = []
+# Set by the first shutdown signal; a second one kills the servers
+_shutdown_requested = False
 
 # Colors for terminal output
+# Only used when stdout is a terminal; piped output (log files, CI, Docker,
+# journald) gets plain text instead of escape sequences
 class Colors:
-    GREEN = '\033[92m'
-    BLUE = '\033[94m'
-    YELLOW = '\033[93m'
-    RED = '\033[91m'
-    RESET = '\033[0m'
-    BOLD = '\033[1m'
+    _IS_TTY = sys.stdout.isatty()
+    GREEN = '\033[92m' if _IS_TTY else ''
+    BLUE = '\033[94m' if _IS_TTY else ''
+    YELLOW = '\033[93m' if _IS_TTY else ''
+    RED = '\033[91m' if _IS_TTY else ''
+    RESET = '\033[0m' if _IS_TTY else ''
+    BOLD = '\033[1m' if _IS_TTY else ''
+
+# Ends a relayed output line (resets the color before the newline)
+_RESET_NEWLINE = f"{Colors.RESET}\n".encode()
 
 def print_colored(message, color=Colors.RESET):
     """Print a colored message."""
     print(f"{color}{message}{Colors.RESET}")
 
+def get_venv_python():
+    """Get the path of the backend venv's Python executable."""
+    if sys.platform == "win32":
+        return os.path.join(BACKEND_DIR, "venv", "Scripts", "python.exe")
+    return os.path.join(BACKEND_DIR, "venv", "bin", "python")
+
+def dir_entries(path):
+    """List the names in a directory with one scandir (empty if it's missing)."""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except OSError:
+        return set()
+
 def check_backend_setup():
     """Check if backend is properly set up."""
-    venv_path = BACKEND_DIR / "venv"
-    if not venv_path.exists():
+    # One directory listing instead of a stat per file
+    entries = dir_entries(BACKEND_DIR)
+    if "venv" not in entries:
         print_colored("❌ Backend virtual environment not found!", Colors.RED)
         print_colored("   Run: cd backend && python -m venv venv", Colors.YELLOW)
         return False
     
-    requirements_file = BACKEND_DIR / "requirements.txt"
-    if not requirements_file.exists():
+    if "requirements.txt" not in entries:
         print_colored("❌ Backend requirements.txt not found!", Colors.RED)
         return False
     
-    env_file = BACKEND_DIR / ".env"
-    if not env_file.exists():
+    if ".env" not in entries:
         print_colored("⚠️  Backend .env file not found!", Colors.YELLOW)
         print_colored("   Create backend/.env with your configuration", Colors.YELLOW)
         print_colored("   See backend/.env.example for reference", Colors.YELLOW)
@@ -65,148 +89,378 @@ def check_backend_setup():
 
 def check_frontend_setup():
     """Check if frontend is properly set up."""
-    node_modules = FRONTEND_DIR / "node_modules"
-    if not node_modules.exists():
+    entries = dir_entries(FRONTEND_DIR)
+    if "node_modules" not in entries:
         print_colored("⚠️  Frontend node_modules not found!", Colors.YELLOW)
         print_colored("   Run: cd frontend && npm install", Colors.YELLOW)
         return False
     
-    package_json = FRONTEND_DIR / "package.json"
-    if not package_json.exists():
+    if "package.json" not in entries:
         print_colored("❌ Frontend package.json not found!", Colors.RED)
         return False
     
     return True
 
-def start_backend():
-    """Start the backend server."""
+def get_backend_env():
+    """
+    Build the backend's environment: ours, with the venv activated.
+    
+    Sets what `source venv/bin/activate` would (VIRTUAL_ENV and the venv's
+    scripts first on PATH), and PYTHONUNBUFFERED so the backend's output
+    reaches us as it's written instead of in block-buffered chunks when piped.
+    """
+    venv = os.path.join(BACKEND_DIR, "venv")
+    scripts = os.path.join(venv, "Scripts" if sys.platform == "win32" else "bin")
+    env = dict(os.environ)
+    env["VIRTUAL_ENV"] = venv
+    env["PATH"] = scripts + os.pathsep + env.get("PATH", "")
+    env["PYTHONUNBUFFERED"] = "1"
+    return env
+
+def exec_server(cmd, cwd, env=None):
+    """
+    Replace this process with a server command run from cwd.
+    
+    Used when only one server runs: the server inherits the terminal directly,
+    so there is no extra process and no thread relaying its output. Never returns.
+    """
+    print_colored("\n   Press Ctrl+C to stop the server\n", Colors.YELLOW)
+    sys.stdout.flush()
+    os.chdir(cwd)  # Nothing of this process is left after exec
+    os.execvpe(cmd[0], cmd, os.environ if env is None else env)
+
+def spawn_server(cmd, cwd, env=None):
+    """
+    Start a server command as a child process with its output piped to us.
+    
+    The child runs from cwd (this process's working directory is left alone)
+    in its own session, so it doesn't share our process group and terminal
+    signals; close_fds keeps it from inheriting our other descriptors (it is
+    only the default on POSIX). env defaults to ours.
+    """
+    import subprocess
+    
+    return subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        env=env,
+        stdin=subprocess.DEVNULL,  # Outside our session the terminal isn't theirs to read
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        bufsize=0,  # Raw bytes; relay_output() forwards them in bulk
+        start_new_session=True,
+        close_fds=True
+    )
+
+def wait_port(host, port, timeout=15.0, process=None):
+    """
+    Wait until a TCP port accepts connections.
+    
+    Args:
+        host: Host to connect to
+        port: Port to connect to
+        timeout: Give up after this many seconds
+        process: Stop waiting early if this server process exits
+    
+    Returns:
+        True once the port accepts a connection, False on timeout or exit
+    """
+    import socket
+    import time
+    
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection((host, port), timeout=0.2):
+                return True
+        except OSError:
+            if process is not None and process.poll() is not None:
+                return False
+            time.sleep(0.05)
+    return False
+
+def start_backend(dev=True, replace_process=False):
+    """
+    Start the backend server.
+    
+    Args:
+        dev: Reload on code changes (development). When False (unified/production
+             mode), run a single worker without the file watcher or access log.
+        replace_process: Exec into uvicorn instead of starting a child process
+    """
     print_colored("\n🚀 Starting Backend Server...", Colors.BLUE)
     
-    # Change to backend directory
-    os.chdir(BACKEND_DIR)
+    # Start uvicorn with the venv's Python (no activation needed)
+    python_exe = get_venv_python()
     
-    # Activate venv and start uvicorn
-    # On Unix/Mac: source venv/bin/activate
-    # On Windows: venv\Scripts\activate
-    if sys.platform == "win32":
-        activate_script = BACKEND_DIR / "venv" / "Scripts" / "activate.bat"
-        python_exe = BACKEND_DIR / "venv" / "Scripts" / "python.exe"
-    else:
-        activate_script = BACKEND_DIR / "venv" / "bin" / "activate"
-        python_exe = BACKEND_DIR / "venv" / "bin" / "python"
-    
-    if not python_exe.exists():
+    if not os.path.exists(python_exe):
         print_colored("❌ Python executable not found in venv!", Colors.RED)
         return None
     
+    # Run the venv's uvicorn console script directly, which skips `-m`'s
+    # module lookup; fall back to `python -m uvicorn` if it's missing
+    if sys.platform == "win32":
+        uvicorn_exe = os.path.join(BACKEND_DIR, "venv", "Scripts", "uvicorn.exe")
+    else:
+        uvicorn_exe = os.path.join(BACKEND_DIR, "venv", "bin", "uvicorn")
+    if os.path.exists(uvicorn_exe):
+        cmd = [uvicorn_exe]
+    else:
+        cmd = [python_exe, "-m", "uvicorn"]
+    
     # Start uvicorn server
-    cmd = [
-        str(python_exe),
-        "-m", "uvicorn",
+    cmd += [
         "app.main:app",
         "--host", "0.0.0.0",
         "--port", "8000",
-        "--reload"
+        # "auto" uses the C event loop and HTTP parser (uvloop, httptools from
+        # uvicorn[standard]) when they import, and asyncio/h11 otherwise, e.g.
+        # on Windows where uvloop isn't available
+        "--loop", "auto",
+        "--http", "auto",
+        "--ws-per-message-deflate", "false",  # Frames are small; compression only costs CPU
+        "--ws-ping-interval", "10",  # Detect dead clients within ~20s instead of ~40s
+        "--ws-ping-timeout", "10",
     ]
+    if dev:
+        cmd.append("--reload")
+    else:
+        # No reloader process or file watching, and no per-request log line
+        cmd += ["--workers", "1", "--no-access-log"]
     
     print_colored(f"   Backend will be available at: http://localhost:8000", Colors.GREEN)
     print_colored(f"   API docs at: http://localhost:8000/docs", Colors.GREEN)
     
-    process = subprocess.Popen(
-        cmd,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        universal_newlines=True,
-        bufsize=1
-    )
+    if replace_process:
+        exec_server(cmd, BACKEND_DIR, get_backend_env())
     
-    return process
+    return spawn_server(cmd, BACKEND_DIR, get_backend_env())
 
-def start_frontend():
-    """Start the frontend development server."""
-    print_colored("\n🚀 Starting Frontend Server...", Colors.BLUE)
+def start_frontend(replace_process=False):
+    """
+    Start the frontend development server.
     
-    # Change to frontend directory
-    os.chdir(FRONTEND_DIR)
+    Args:
+        replace_process: Exec into npm instead of starting a child process
+    """
+    print_colored("\n🚀 Starting Frontend Server...", Colors.BLUE)
     
     # Check if npm is available
-    try:
-        subprocess.run(["npm", "--version"], check=True, capture_output=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    if NPM is None:
         print_colored("❌ npm not found! Please install Node.js and npm.", Colors.RED)
         return None
     
     # Start Vite dev server
-    cmd = ["npm", "run", "dev"]
+    cmd = [NPM, "--prefix", FRONTEND_DIR, "run", "dev"]
     
     print_colored(f"   Frontend will be available at: http://localhost:5173", Colors.GREEN)
     
+    if replace_process:
+        exec_server(cmd, FRONTEND_DIR)
+    
+    return spawn_server(cmd, FRONTEND_DIR)
+
+def build_frontend():
+    """Build the frontend for production."""
+    print_colored("\n🔨 Building Frontend...", Colors.BLUE)
+    
+    # Check if npm is available
+    if NPM is None:
+        print_colored("❌ npm not found! Please install Node.js and npm.", Colors.RED)
+        return False
+    
+    # Run build command
+    # npm is pointed at the frontend with --prefix and run from it with cwd=,
+    # so this process's working directory never changes
+    cmd = [NPM, "--prefix", FRONTEND_DIR, "run", "build"]
+    
+    print_colored("   Running: npm run build", Colors.YELLOW)
+    
+    import subprocess
+    from collections import deque
+    
+    # Stream the build log as it's produced instead of capturing all of it;
+    # only the last lines are kept for the summary
     process = subprocess.Popen(
         cmd,
+        cwd=FRONTEND_DIR,
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
-        universal_newlines=True,
+        text=True,
         bufsize=1
     )
-    
-    return process
+    tail = deque(maxlen=200)
+    for line in process.stdout:
+        tail.append(line)
+        sys.stdout.write(f"   {line}")
+    sys.stdout.flush()
+    
+    if process.wait() == 0:
+        print_colored("✅ Frontend build completed successfully!", Colors.GREEN)
+        # Show build output summary
+        for line in tail:
+            if "built in" in line or "dist/" in line:
+                print_colored(f"   {line.strip()}", Colors.GREEN)
+        return True
+    else:
+        # The error output was streamed above
+        print_colored("❌ Frontend build failed!", Colors.RED)
+        return False
 
-def build_frontend():
-    """Build the frontend for production."""
-    print_colored("\n🔨 Building Frontend...", Colors.BLUE)
+def prefix_lines(data, prefix):
+    """
+    Prefix every complete line in a chunk of raw output.
+    
+    Reads can end mid-line; the incomplete tail is returned so it can be
+    completed by the next read. Only whole lines are written, so lines from
+    different servers never interleave.
+    
+    Args:
+        data: Bytes read from a server's output pipe (after any leftover tail)
+        prefix: Pre-encoded color and "[Name] " prefix
+    
+    Returns:
+        (bytes to write, incomplete last line)
+    """
+    cut = data.rfind(b"\n") + 1
+    if not cut:
+        return b"", data
+    lines = data[:cut - 1].replace(b"\n", _RESET_NEWLINE + prefix)
+    return prefix + lines + _RESET_NEWLINE, data[cut:]
+
+def relay_output(processes):
+    """
+    Forward the servers' output to our stdout until all of them close it.
     
-    # Change to frontend directory
-    original_dir = os.getcwd()
-    os.chdir(FRONTEND_DIR)
+    Reads each pipe in bulk (up to 64 KiB per read) and writes the bytes
+    straight to stdout with a per-server color prefix, instead of decoding,
+    formatting and printing each line.
     
-    try:
-        # Check if npm is available
-        try:
-            subprocess.run(["npm", "--version"], check=True, capture_output=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            print_colored("❌ npm not found! Please install Node.js and npm.", Colors.RED)
-            return False
-        
-        # Run build command
-        cmd = ["npm", "run", "build"]
+    Args:
+        processes: List of (name, process, color) with stdout pipes
+    """
+    sys.stdout.flush()  # Keep earlier print() output ahead of the relayed bytes
+    out = sys.stdout.buffer
+    
+    if sys.platform == "win32":
+        # selectors can't wait on pipes on Windows: one reader thread per pipe
+        import threading
         
-        print_colored("   Running: npm run build", Colors.YELLOW)
+        lock = threading.Lock()
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        def relay_pipe(name, process, color):
+            fd = process.stdout.fileno()
+            prefix = f"{color}[{name}] ".encode()
+            tail = b""
+            try:
+                while True:
+                    buf = os.read(fd, 65536)
+                    if not buf:
+                        # EOF: the server exited; end its last line if needed
+                        if not tail:
+                            return
+                        buf = b"\n"
+                    # Console programs end lines with CRLF here; drop the CR so
+                    # the color reset isn't written after it
+                    chunk, tail = prefix_lines((tail + buf).replace(b"\r\n", b"\n"), prefix)
+                    with lock:
+                        out.write(chunk)
+                        out.flush()
+            except Exception as e:
+                print_colored(f"Error monitoring {name}: {e}", Colors.RED)
         
-        if result.returncode == 0:
-            print_colored("✅ Frontend build completed successfully!", Colors.GREEN)
-            # Show build output summary
-            if "built in" in result.stdout:
-                for line in result.stdout.split('\n'):
-                    if "built in" in line or "dist/" in line:
-                        print_colored(f"   {line.strip()}", Colors.GREEN)
-            return True
-        else:
-            print_colored("❌ Frontend build failed!", Colors.RED)
-            if result.stderr:
-                print_colored(f"   Error: {result.stderr[:200]}", Colors.RED)
-            return False
-    finally:
-        os.chdir(original_dir)
+        threads = [
+            threading.Thread(target=relay_pipe, args=entry, daemon=True)
+            for entry in processes
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return
+    
+    import selectors
+    
+    selector = selectors.DefaultSelector()
+    # fd -> [prefix, incomplete last line]
+    streams = {}
+    for name, process, color in processes:
+        fd = process.stdout.fileno()
+        # Non-blocking, so a spurious wakeup can never stall the loop in read()
+        os.set_blocking(fd, False)
+        streams[fd] = [f"{color}[{name}] ".encode(), b""]
+        selector.register(fd, selectors.EVENT_READ)
+    
+    while streams:
+        for key, _ in selector.select():
+            stream = streams[key.fd]
+            try:
+                buf = os.read(key.fd, 65536)
+            except BlockingIOError:
+                continue  # Nothing to read after all
+            if not buf:
+                # EOF: the server exited; end its last line if needed
+                selector.unregister(key.fd)
+                del streams[key.fd]
+                if not stream[1]:
+                    continue
+                buf = b"\n"
+            chunk, stream[1] = prefix_lines(stream[1] + buf, stream[0])
+            out.write(chunk)
+            out.flush()
+    selector.close()
 
-def print_output(process, name, color):
-    """Print output from a subprocess."""
-    try:
-        for line in process.stdout:
-            line = line.rstrip()
-            if line:
-                print_colored(f"[{name}] {line}", color)
-    except Exception as e:
-        print_colored(f"Error reading {name} output: {e}", Colors.RED)
+def signal_servers(force=False):
+    """
+    Ask every running server to stop (or kill it when force is set).
+    
+    Servers run in their own sessions (start_new_session in spawn_server), so
+    the signal goes to each one's process group (pgid == pid), which also
+    reaches the processes they started themselves (e.g. vite under npm).
+    The group is signalled even if the server itself has exited, since its
+    children may still be running.
+    """
+    import signal
+    
+    for name, process, _ in _PROCS:
+        try:
+            if sys.platform == "win32":
+                # No process groups or SIGKILL; both of these end the process
+                if process.poll() is None:
+                    process.kill() if force else process.terminate()
+            else:
+                os.killpg(process.pid, signal.SIGKILL if force else signal.SIGTERM)
+        except ProcessLookupError:
+            pass  # The whole group has exited
+        except Exception as e:
+            print_colored(f"Error stopping {name}: {e}", Colors.RED)
 
 def signal_handler(sig, frame):
-    """Handle Ctrl+C gracefully."""
-    print_colored("\n\n🛑 Shutting down servers...", Colors.YELLOW)
-    sys.exit(0)
+    """
+    Handle Ctrl+C, SIGTERM, SIGHUP and SIGQUIT gracefully.
+    
+    The first signal forwards SIGTERM to the servers; the main loop then sees
+    their output close and falls through to the cleanup in main(). A second
+    signal kills them immediately.
+    """
+    global _shutdown_requested
+    if not _PROCS:
+        # Nothing started yet, so nothing to clean up
+        sys.exit(0)
+    # Written straight to the fd: the handler may interrupt a write to
+    # sys.stdout, and buffered writers can't be re-entered
+    if _shutdown_requested:
+        os.write(sys.stdout.fileno(), f"{Colors.RED}\n🛑 Killing servers...{Colors.RESET}\n".encode())
+        signal_servers(force=True)
+        return
+    _shutdown_requested = True
+    os.write(sys.stdout.fileno(), f"{Colors.YELLOW}\n\n🛑 Shutting down servers... (Ctrl+C again to force){Colors.RESET}\n".encode())
+    signal_servers()
 
 def main():
     """Main function."""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description="Start Virtual AI Interview Room servers",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -217,6 +471,8 @@ Examples:
   python start.py --frontend-only # Start only frontend
   python start.py --build         # Build frontend then start both
   python start.py --build-only   # Only build frontend
+  python start.py --unified       # Build frontend, serve it from the backend
+                                  # (production: no --reload, no access log)
         """
     )
     
@@ -252,9 +508,20 @@ Examples:
     
     args = parser.parse_args()
     
+    # Look npm up on PATH once, instead of running `npm --version` (which
+    # takes hundreds of ms) before every npm command
+    import shutil
+    import signal
+    import subprocess
+    
+    global NPM
+    NPM = shutil.which("npm")
+    
     # Set up signal handler for graceful shutdown
-    signal.signal(signal.SIGINT, signal_handler)
-    signal.signal(signal.SIGTERM, signal_handler)
+    # SIGHUP (terminal closed, nohup) and SIGQUIT don't exist on Windows
+    for sig_name in ("SIGINT", "SIGTERM", "SIGHUP", "SIGQUIT"):
+        if hasattr(signal, sig_name):
+            signal.signal(getattr(signal, sig_name), signal_handler)
     
     print_colored("=" * 60, Colors.BOLD)
     print_colored("  Virtual AI Interview Room - Startup Script", Colors.BOLD)
@@ -299,92 +566,85 @@ Examples:
         print_colored("\n❌ Frontend setup check failed!", Colors.RED)
         sys.exit(1)
     
+    # With a single server, exec into it rather than relaying its output
+    # through a pipe. Not on Windows, where exec starts a new process and
+    # exits this one instead of replacing it
+    exec_single = start_backend_flag != start_frontend_flag and sys.platform != "win32"
+    
     # Start servers
-    processes = []
+    processes = _PROCS
     
     if start_backend_flag:
-        backend_process = start_backend()
+        backend_process = start_backend(dev=not args.unified, replace_process=exec_single)
         if backend_process:
             processes.append(("Backend", backend_process, Colors.BLUE))
         else:
             print_colored("❌ Failed to start backend!", Colors.RED)
             sys.exit(1)
     
-    if start_frontend_flag:
-        # Wait a bit for backend to start
-        if start_backend_flag:
-            time.sleep(2)
-        
-        frontend_process = start_frontend()
+    # Wait for the backend to accept connections, so the frontend's first
+    # requests don't fail (returns as soon as uvicorn is listening)
+    if start_frontend_flag and start_backend_flag:
+        backend_ready = wait_port("127.0.0.1", 8000, process=backend_process)
+        if not backend_ready and not _shutdown_requested:
+            print_colored("⚠️  Backend is not accepting connections yet, starting frontend anyway", Colors.YELLOW)
+    
+    # A shutdown signal during the wait has already stopped the backend: start
+    # nothing else and go straight to the cleanup below
+    if start_frontend_flag and not _shutdown_requested:
+        frontend_process = start_frontend(replace_process=exec_single)
         if frontend_process:
             processes.append(("Frontend", frontend_process, Colors.GREEN))
         else:
             print_colored("❌ Failed to start frontend!", Colors.RED)
-            # Kill backend if it was started
-            if start_backend_flag and backend_process:
-                backend_process.terminate()
+            # Stop the backend if it was started
+            signal_servers()
             sys.exit(1)
     
-    # Print startup summary
-    print_colored("\n" + "=" * 60, Colors.BOLD)
-    print_colored("  ✅ Servers Starting...", Colors.GREEN)
-    print_colored("=" * 60, Colors.RESET)
+    # Print startup summary (skipped when already shutting down)
+    if not _shutdown_requested:
+        print_colored("\n" + "=" * 60, Colors.BOLD)
+        print_colored("  ✅ Servers Starting...", Colors.GREEN)
+        print_colored("=" * 60, Colors.RESET)
     
-    if start_backend_flag:
-        if args.unified:
-            print_colored("   Backend + Frontend: http://localhost:8000", Colors.BLUE)
-            print_colored("   API Docs: http://localhost:8000/docs", Colors.BLUE)
-            print_colored("   Health: http://localhost:8000/api/health", Colors.BLUE)
-        else:
-            print_colored("   Backend:  http://localhost:8000", Colors.BLUE)
-            print_colored("   API Docs: http://localhost:8000/docs", Colors.BLUE)
+        if start_backend_flag:
+            if args.unified:
+                print_colored("   Backend + Frontend: http://localhost:8000", Colors.BLUE)
+                print_colored("   API Docs: http://localhost:8000/docs", Colors.BLUE)
+                print_colored("   Health: http://localhost:8000/api/health", Colors.BLUE)
+            else:
+                print_colored("   Backend:  http://localhost:8000", Colors.BLUE)
+                print_colored("   API Docs: http://localhost:8000/docs", Colors.BLUE)
     
-    if start_frontend_flag:
-        print_colored("   Frontend: http://localhost:5173", Colors.GREEN)
+        if start_frontend_flag:
+            print_colored("   Frontend: http://localhost:5173", Colors.GREEN)
     
-    print_colored("\n   Press Ctrl+C to stop all servers\n", Colors.YELLOW)
-    print_colored("=" * 60 + "\n", Colors.RESET)
+        print_colored("\n   Press Ctrl+C to stop all servers\n", Colors.YELLOW)
+        print_colored("=" * 60 + "\n", Colors.RESET)
     
     # Monitor processes and print output
     try:
-        import threading
-        
-        def monitor_process(name, process, color):
-            """Monitor a single process."""
-            try:
-                for line in process.stdout:
-                    line = line.rstrip()
-                    if line:
-                        print_colored(f"[{name}] {line}", color)
-            except Exception as e:
-                print_colored(f"Error monitoring {name}: {e}", Colors.RED)
-        
-        # Start monitoring threads
-        threads = []
-        for name, process, color in processes:
-            thread = threading.Thread(
-                target=monitor_process,
-                args=(name, process, color),
-                daemon=True
-            )
-            thread.start()
-            threads.append(thread)
+        relay_output(processes)
         
         # Wait for processes
         for name, process, _ in processes:
+            if _shutdown_requested:
+                break  # The cleanup below waits with a timeout
             process.wait()
     
     except KeyboardInterrupt:
         print_colored("\n\n🛑 Shutting down servers...", Colors.YELLOW)
     
     finally:
-        # Terminate all processes
+        # Stop all servers (no-op for those that already exited), then
+        # kill any that are still running after 5 seconds
+        signal_servers()
         for name, process, _ in processes:
             try:
-                process.terminate()
                 process.wait(timeout=5)
             except subprocess.TimeoutExpired:
-                process.kill()
+                signal_servers(force=True)
+                process.wait()
             except Exception as e:
                 print_colored(f"Error stopping {name}: {e}", Colors.RED)
         